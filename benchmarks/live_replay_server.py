@@ -0,0 +1,147 @@
+import argparse
+import glob
+import hashlib
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+LIVE_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'live')
+
+
+class ReplayState:
+
+    # hands out the recorded polls in order and stays on the last one, each
+    # snapshot repeated so clients see both 200 and 304 responses
+
+    def __init__(self, fixtures_dir=LIVE_FIXTURES, repeat=2):
+
+        self.snapshots = []
+
+        for file_path in sorted(glob.glob(os.path.join(fixtures_dir, 'poll_*.json'))):
+            with open(file_path, 'rb') as f:
+                self.snapshots.append(f.read())
+
+        if not self.snapshots:
+            raise FileNotFoundError(f'No poll_*.json files in {fixtures_dir}; run benchmarks/make_fixtures.py first.')
+
+        self.repeat = repeat
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def next(self):
+
+        with self._lock:
+            i = min(self.requests // self.repeat, len(self.snapshots) - 1)
+            self.requests += 1
+
+        body = self.snapshots[i]
+
+        return body, '"' + hashlib.md5(body).hexdigest() + '"'
+
+
+def make_handler(state):
+
+    class LiveHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+
+            url = urlparse(self.path)
+
+            if not url.path.endswith('/live_results_fetch_round') or 'TournID' not in parse_qs(url.query):
+                self.send_error(404)
+                return None
+
+            body, etag = state.next()
+
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return None
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+            return None
+
+        def log_message(self, format, *args):
+            return None
+
+    return LiveHandler
+
+
+def serve(port=0, fixtures_dir=LIVE_FIXTURES, repeat=2):
+
+    # returns a running server; base_url for LivePoller is
+    # f'http://127.0.0.1:{server.server_port}'
+    state = ReplayState(fixtures_dir, repeat)
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(state))
+    server.state = state
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def replay(port=0, polls=None, fixtures_dir=LIVE_FIXTURES, repeat=2):
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from functions import LivePoller, Standings, configure_rate_limit
+
+    configure_rate_limit(rate=1000)
+
+    server = serve(port, fixtures_dir, repeat)
+    standings = Standings()
+    poller = LivePoller(
+        event_number=71315,
+        event_name='LIVE REPLAY, 2023',
+        year=2023,
+        standings=standings,
+        base_url=f'http://127.0.0.1:{server.server_port}',
+    )
+
+    polls = polls or len(server.state.snapshots) * repeat
+
+    for i in range(polls):
+        changes = poller.poll()
+        print(f'poll {i:02d}: {len(changes)} changed')
+
+    server.shutdown()
+
+    leaders = sorted(standings.players.items(), key=lambda x: x[1]['total'])[:5]
+    print('Leaders:', ', '.join(f'{poller.snapshot[pdga][0]} ({player["total"]})' for pdga, player in leaders))
+
+    return standings
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description='Replay recorded live scoring polls over HTTP.')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--repeat', type=int, default=2, help='times each snapshot is served before moving on')
+    parser.add_argument('--fixtures', default=LIVE_FIXTURES)
+    parser.add_argument('--poll', action='store_true', help='run a LivePoller against the server and print what changed')
+    args = parser.parse_args()
+
+    if args.poll:
+        return replay(args.port, fixtures_dir=args.fixtures, repeat=args.repeat)
+
+    server = serve(args.port, args.fixtures, args.repeat)
+    print(f'Replaying {len(server.state.snapshots)} polls on http://127.0.0.1:{server.server_port}')
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+    return None
+
+
+if __name__ == '__main__':
+    main()
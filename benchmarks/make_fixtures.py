@@ -0,0 +1,258 @@
+import argparse
+import glob
+import html
+import json
+import os
+import random
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+CSV_RESULTS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'csv_results')
+
+
+def fixture_urls():
+
+    # what --record fetches for each fixture
+    return {
+        'event_leaderboard.html': 'https://www.pdga.com/tour/event/71315',
+        'tour_search.html': 'https://www.pdga.com/tour/search?date_filter[min][date]=2023-01-01&date_filter[max][date]=2023-12-31&Tier[]=ES&Tier[]=M&Classification[]=Pro',
+        'players_search.html': 'https://www.pdga.com/players?FirstName=Simon&LastName=Lizotte',
+        'ranking.html': 'https://www.pdga.com/united-states-tour-ranking-open',
+        'player_profile.html': 'https://www.pdga.com/player/8332',
+    }
+
+
+def page(title, body):
+
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{html.escape(title)} | Professional Disc Golf Association</title></head>
+<body>
+<header class="header"><nav class="menu">{''.join(f'<a href="/nav/{i}">Link {i}</a>' for i in range(60))}</nav></header>
+<div class="pane-page-title"><h1>{html.escape(title)}</h1></div>
+{body}
+<footer class="footer">{''.join(f'<p class="footer-item">Footer text {i}</p>' for i in range(40))}</footer>
+</body>
+</html>
+'''
+
+
+def season_results():
+
+    frames = []
+
+    for file_path in sorted(glob.glob(os.path.join(CSV_RESULTS, '*.csv'))):
+        frame = pd.read_csv(file_path, index_col=0)
+        frame['Event'] = os.path.basename(file_path)[len('Results_'):-len('.csv')].replace('-', ' ')
+        frames.append(frame)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def leaderboard_html(results, rounds=4):
+
+    rows = []
+
+    for i, row in enumerate(results.itertuples(index=False)):
+        row_class = 'odd' if i % 2 == 0 else 'even'
+        if row.Score == 'DNF':
+            score = '<td class="dnf">DNF</td>'
+        else:
+            score = f'<td class="par">{html.escape(str(row.Score))}</td>'
+        round_cells = ''.join(
+            f'<td class="round tooltip" title="{r}">{55 + (i + r) % 10}</td><td class="round-rating">{row._3 + (r % 3) * 5}</td>'
+            for r in range(rounds)
+        )
+        rows.append(
+            f'<tr class="{row_class}">'
+            f'<td class="place">{row.Place}</td>'
+            f'<td class="player"><a href="/player/{row._2}">{html.escape(row.Player)}</a></td>'
+            f'<td class="pdga-number">{row._2}</td>'
+            f'<td class="player-rating propagator">{row._3}</td>'
+            f'{score}{round_cells}<td class="total">{230 + i % 40}</td></tr>'
+        )
+
+    header = '<tr><th class="place">Place</th><th class="player">Name</th><th class="pdga-number">PDGA#</th><th class="player-rating">Rating</th><th class="par">Par</th>' + ''.join(f'<th class="round">Rd{r + 1}</th><th class="round-rating"></th>' for r in range(rounds)) + '<th class="total">Total</th></tr>'
+
+    return f'<div class="table-container"><table class="results"><thead>{header}</thead><tbody>{"".join(rows)}</tbody></table></div>'
+
+
+def event_leaderboard(results, size=600):
+
+    # one very large field: the season's results re-ranked by score
+    field = results.drop_duplicates('PDGA Number').head(size).copy()
+    field['Place'] = range(1, len(field) + 1)
+    fpo = results.drop_duplicates('PDGA Number').tail(60).copy()
+    fpo['Place'] = range(1, len(fpo) + 1)
+
+    info = '<ul class="event-info info-list"><li class="tournament-date"><strong>Date</strong>: 06-Oct to 09-Oct-2023</li><li class="tournament-location">Rock Hill, SC</li></ul><div class="tournament-status">Status: Event complete; official ratings processed.</div>'
+
+    body = (
+        info
+        + '<div class="leaderboard singletable">'
+        + '<h3 class="division">MPO</h3>' + leaderboard_html(field)
+        + '<h3 class="division">FPO</h3>' + leaderboard_html(fpo)
+        + '</div>'
+    )
+
+    return page('USDGC', body)
+
+
+def tour_search(results):
+
+    events = results['Event'].drop_duplicates().tolist()
+    rows = []
+
+    for i, event_name in enumerate(events):
+        row_class = 'odd' if i % 2 == 0 else 'even'
+        rows.append(
+            f'<tr class="{row_class}">'
+            f'<td class="views-field views-field-OfficialName"><a href="/tour/event/{65000 + i}">{html.escape(event_name)}</a></td>'
+            f'<td class="views-field views-field-StartDate">{(i % 28) + 1:02d}-Mar-2023</td>'
+            f'<td class="views-field views-field-Tier">{"M" if i % 5 == 0 else "ES"}</td>'
+            f'<td class="views-field views-field-Classification">Pro</td>'
+            f'<td class="views-field views-field-Location">Somewhere, USA</td></tr>'
+        )
+
+    body = f'<div class="view-content"><div class="table-container"><table class="views-table"><tbody>{"".join(rows)}</tbody></table></div></div>'
+
+    return page('Tournament Search', body)
+
+
+def players_search(results):
+
+    players = results.drop_duplicates('PDGA Number').head(25)
+    rows = []
+
+    for i, row in enumerate(players.itertuples(index=False)):
+        row_class = 'odd' if i % 2 == 0 else 'even'
+        rows.append(
+            f'<tr class="{row_class}">'
+            f'<td class="views-field views-field-LastName"><a href="/player/{row._2}">{html.escape(row.Player)}</a></td>'
+            f'<td class="views-field views-field-PDGANum pdga-number">{row._2}</td>'
+            f'<td class="views-field views-field-Rating">{row._3}</td>'
+            f'<td class="views-field views-field-City">Somewhere</td></tr>'
+        )
+
+    body = f'<div class="table-container"><table class="views-table"><tbody>{"".join(rows)}</tbody></table></div>'
+
+    return page('Players', body)
+
+
+def ranking(results):
+
+    players = results.drop_duplicates('PDGA Number').head(300)
+    rows = ''.join(
+        f'<tr><td class="rank">{i + 1}</td><td><a class="player-profile-link" href="/player/{row._2}">{html.escape(row.Player)}</a></td><td class="points">{1000 - i}</td></tr>'
+        for i, row in enumerate(players.itertuples(index=False))
+    )
+
+    return page('United States Tour Ranking - Open', f'<div class="ranking-table table"><table><tbody>{rows}</tbody></table></div>')
+
+
+def player_profile():
+
+    body = '''<ul class="player-info info-list">
+<li class="location"><strong>Location: </strong>Hamburg, Germany</li>
+<li class="membership-status"><strong>Membership Status: </strong>Current</li>
+<li class="current-rating"><strong>Current Rating:</strong> 1042 <small>(as of 10-Oct-2023)</small></li>
+<li class="career-events"><strong>Career Events:</strong> 371</li>
+</ul>'''
+
+    return page('Simon Lizotte #8332', body)
+
+
+def live_polls(results, polls=12, size=72, holes=18, seed=2023):
+
+    # snapshots of one round as the live scoring app returns them; places
+    # drift a little each poll and repeated snapshots exercise the 304 path
+    field = results.drop_duplicates('PDGA Number').head(size)
+    rng = random.Random(seed)
+    strokes = {row._2: 0 for row in field.itertuples(index=False)}
+    snapshots = []
+
+    for poll in range(polls):
+        played = min(holes, (poll + 1) * holes // (polls - 2))
+        if poll % 4 != 3:
+            for pdga_number in strokes:
+                strokes[pdga_number] += rng.choice([-1, -1, 0, 0, 0, 1])
+
+        ordered = sorted(field.itertuples(index=False), key=lambda row: (strokes[row._2], row.Player))
+        scores, place = [], 0
+
+        for i, row in enumerate(ordered):
+            if i == 0 or strokes[row._2] != strokes[ordered[i - 1]._2]:
+                place = i + 1
+            scores.append({
+                'ResultID': 100000 + i,
+                'PDGANum': int(row._2),
+                'Name': row.Player,
+                'Rating': int(row._3),
+                'RunningPlace': place,
+                'ToPar': strokes[row._2],
+                'Played': played,
+                'Completed': int(played == holes),
+            })
+
+        snapshots.append({'data': {'live_round_id': 1, 'division': 'MPO', 'scores': scores}})
+
+    return snapshots
+
+
+def record():
+
+    from functions import configure_cache, fetch_content
+
+    configure_cache(enabled=False)
+
+    for file_name, url in fixture_urls().items():
+        with open(os.path.join(FIXTURES, file_name), 'wb') as f:
+            f.write(fetch_content(url))
+        print(f'{file_name} recorded from {url}')
+
+    return None
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description='Build the HTML fixtures used by benchmarks/run.py.')
+    parser.add_argument('--record', action='store_true', help='fetch the live pages instead of building them from csv_results')
+    args = parser.parse_args()
+
+    os.makedirs(FIXTURES, exist_ok=True)
+
+    if args.record:
+        return record()
+
+    results = season_results()
+
+    fixtures = {
+        'event_leaderboard.html': event_leaderboard(results),
+        'tour_search.html': tour_search(results),
+        'players_search.html': players_search(results),
+        'ranking.html': ranking(results),
+        'player_profile.html': player_profile(),
+    }
+
+    for file_name, content in fixtures.items():
+        with open(os.path.join(FIXTURES, file_name), 'w', encoding='utf-8') as f:
+            f.write(content)
+        print(f'{file_name} has been saved.')
+
+    os.makedirs(os.path.join(FIXTURES, 'live'), exist_ok=True)
+
+    for i, snapshot in enumerate(live_polls(results)):
+        file_name = os.path.join('live', f'poll_{i:02d}.json')
+        with open(os.path.join(FIXTURES, file_name), 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f)
+        print(f'{file_name} has been saved.')
+
+    return None
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions import (
+    Event, Player, PlayerRegistry, SeasonResults, deep_sizeof, event_table_dict,
+    insert_data, memory_report, players_links_list, score_season
+)
+from run import use_fixtures
+
+
+def history(years, events_per_year, n_players):
+
+    events = [
+        Event(name=f'Benchmark Open {i}', url=f'https://www.pdga.com/tour/event/{60000 + year * 100 + i}', year=year, fast=True)
+        for year in years
+        for i in range(events_per_year)
+    ]
+
+    registry = PlayerRegistry()
+    registry.add_event(events[0])
+
+    players = [Player(url=link, registry=registry) for link in players_links_list()[:n_players]]
+
+    for year in years:
+        score_season([event for event in events if event.year == year], players)
+
+    return events, players
+
+
+def legacy_event_size(event):
+
+    # what an Event used to hold: an object-dtype frame plus the INSERT
+    # rendered up front
+    frame = event.results_df.astype(object)
+    frame['Score'] = frame['Score'].astype(str)
+    query = insert_data(event.table_name, event_table_dict(), frame.to_dict('records'))
+
+    return deep_sizeof(frame) + sys.getsizeof(query)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description='Report the memory held by a loaded multi-year history.')
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--events', type=int, default=20, help='events per year')
+    parser.add_argument('--players', type=int, default=150)
+    args = parser.parse_args()
+
+    use_fixtures()
+
+    years = list(range(2024 - args.years, 2024))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        events, players = history(years, args.events, args.players)
+
+    season = SeasonResults(events)
+    report = memory_report(events=events, players=players, season=season)
+    legacy_events = sum(legacy_event_size(event) for event in events)
+
+    mb = 1024 ** 2
+
+    print(f'{args.years} years x {args.events} events, {len(season):,} results, {len(players)} players\n')
+    print(f'{"events (compact results_df, lazy SQL)":<44} {report["events"] / mb:>8.1f} MB')
+    print(f'{"events (object dtype + rendered INSERT)":<44} {legacy_events / mb:>8.1f} MB')
+    print(f'{"players":<44} {report["players"] / mb:>8.1f} MB')
+    print(f'{"season results as typed arrays":<44} {report["season"] / mb:>8.1f} MB')
+
+    return None
+
+
+if __name__ == '__main__':
+    main()
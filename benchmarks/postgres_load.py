@@ -0,0 +1,156 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from functions import (
+    connect_to_sql, close_connection, configure_pool, copy_data, create_table,
+    insert_data, event_table_dict, write_league_records
+)
+
+
+def fake_results(n):
+
+    for i in range(n):
+        yield {
+            'Place': i % 150 + 1,
+            'Player': f"Player O'Name {i}",
+            'PDGA Number': 10000 + i,
+            'Player Rating': 900 + i % 150,
+            'Score': 'DNF' if i % 97 == 0 else str(i % 30 - 15),
+        }
+
+
+def time_load(method, n, table_name='Load Benchmark', **sql_kwargs):
+
+    connection, postgres = connect_to_sql(**sql_kwargs)
+    postgres.execute(f'DROP TABLE IF EXISTS "{table_name}";')
+    postgres.execute(create_table(table_name, event_table_dict()))
+    connection.commit()
+
+    start = time.perf_counter()
+
+    if method == 'insert_data':
+        query = insert_data(table_name, event_table_dict(), fake_results(n))
+        postgres.execute(query)
+    else:
+        copy_data(postgres, table_name, event_table_dict(), fake_results(n), method=method)
+
+    connection.commit()
+    elapsed = time.perf_counter() - start
+
+    postgres.execute(f'SELECT count(*) FROM "{table_name}";')
+    assert postgres.fetchone()[0] == n
+
+    postgres.execute(f'DROP TABLE "{table_name}";')
+    close_connection(connection, postgres)
+
+    return elapsed
+
+
+def fake_league_records(n_leagues, teams=10, table_name='League Benchmark'):
+
+    size = n_leagues * teams
+
+    return pd.DataFrame({
+        'League': [f'League {i // teams}' for i in range(size)],
+        'League Table': table_name,
+        'Team Name': [f'Team {i % teams}' for i in range(size)],
+        'Team Owner': [f'Owner {i % teams}' for i in range(size)],
+        'Number of Players': 9,
+        'Number of Active Players': 5,
+        'Wins': [i % 17 for i in range(size)],
+        'Losses': [16 - i % 17 for i in range(size)],
+        'Ties': 0,
+        'First Place': [i % 3 for i in range(size)],
+        'Second Place': [i % 4 for i in range(size)],
+        'Third Place': [i % 5 for i in range(size)],
+    })
+
+
+def time_league_records(n_leagues, table_name='League Benchmark', **sql_kwargs):
+
+    configure_pool(**sql_kwargs)
+    records = fake_league_records(n_leagues, table_name=table_name)
+
+    connection, postgres = connect_to_sql(**sql_kwargs)
+    postgres.execute(f'DROP TABLE IF EXISTS "{table_name}";')
+    connection.commit()
+
+    # the first write inserts every team, the second updates them in place
+    timings = []
+
+    for _ in range(2):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            write_league_records(records)
+        timings.append(time.perf_counter() - start)
+
+    postgres.execute(f'SELECT count(*) FROM "{table_name}";')
+    assert postgres.fetchone()[0] == len(records)
+
+    postgres.execute(f'DROP TABLE "{table_name}";')
+    connection.commit()
+    close_connection(connection, postgres)
+
+    return timings
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description='Time insert_data against copy_data on a local Postgres.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--methods', nargs='+', default=['insert_data', 'values', 'copy'])
+    parser.add_argument('--leagues', type=int, nargs='+', default=[50, 500], help='league counts (10 teams each) for write_league_records')
+    parser.add_argument('--host')
+    parser.add_argument('--port', type=int)
+    parser.add_argument('--database')
+    parser.add_argument('--user')
+    parser.add_argument('--password')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args()
+
+    sql_kwargs = {k: v for k, v in vars(args).items() if k in ['host', 'port', 'database', 'user', 'password'] and v is not None}
+
+    connection, postgres = connect_to_sql(**sql_kwargs)
+    postgres.execute('SHOW server_version;')
+    server_version = postgres.fetchone()[0]
+    close_connection(connection, postgres)
+
+    results = []
+
+    for n in args.sizes:
+        for method in args.methods:
+            elapsed = time_load(method, n, **sql_kwargs)
+            results.append({'method': method, 'rows': n, 'seconds': round(elapsed, 3), 'rows_per_second': round(n / elapsed)})
+            print(f'{method:>12} {n:>9,} rows  {elapsed:8.3f} s  {n / elapsed:>12,.0f} rows/s')
+
+    for n_leagues in args.leagues:
+        for step, elapsed in zip(['insert', 'update'], time_league_records(n_leagues, **sql_kwargs)):
+            n = n_leagues * 10
+            results.append({'method': f'write_league_records ({step})', 'leagues': n_leagues, 'rows': n, 'seconds': round(elapsed, 3), 'rows_per_second': round(n / elapsed)})
+            print(f'{"league " + step:>12} {n:>9,} rows  {elapsed:8.3f} s  {n / elapsed:>12,.0f} rows/s')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'server_version': server_version,
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'results': results,
+            }, f, indent=2)
+        print(f'{args.output} has been saved.')
+
+    return None
+
+
+if __name__ == '__main__':
+    main()
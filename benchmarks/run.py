@@ -0,0 +1,279 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import pandas as pd
+import requests
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import functions
+from functions import (
+    Event, EventSearch, Player, PlayerNameIndex, PlayerRegistry, PlayerSearch, SeasonIndex,
+    configure_cache, configure_rate_limit, configure_search_memo, event_table_dict, get_session,
+    insert_data, players_links_list, score_season, soupify
+)
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+CSV_RESULTS = os.path.join(os.path.dirname(BENCHMARKS), 'csv_results')
+FIXTURES = os.path.join(BENCHMARKS, 'fixtures')
+RESULTS = os.path.join(BENCHMARKS, 'results')
+
+
+def fixture_routes():
+
+    # first matching substring wins
+    return [
+        ('/tour/event/', 'event_leaderboard.html'),
+        ('/tour/search', 'tour_search.html'),
+        ('/players?', 'players_search.html'),
+        ('tour-ranking', 'ranking.html'),
+        ('/player/', 'player_profile.html'),
+    ]
+
+
+class FixtureAdapter(BaseAdapter):
+
+    # serves recorded pages in place of pdga.com so nothing touches the network
+
+    def __init__(self, fixtures_dir=FIXTURES):
+
+        super().__init__()
+        self._pages = {}
+
+        for pattern, file_name in fixture_routes():
+            with open(os.path.join(fixtures_dir, file_name), 'rb') as f:
+                self._pages[pattern] = f.read()
+
+    def send(self, request, **kwargs):
+
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+
+        for pattern, _ in fixture_routes():
+            if pattern in request.url:
+                response.status_code = 200
+                response._content = self._pages[pattern]
+                response.headers['Content-Type'] = 'text/html; charset=utf-8'
+                break
+        else:
+            response.status_code = 404
+            response._content = b''
+
+        return response
+
+    def close(self):
+        return None
+
+
+def use_fixtures():
+
+    configure_cache(enabled=False)
+    configure_search_memo(enabled=False)
+    configure_rate_limit(rate=1e9)
+    get_session().mount('https://www.pdga.com', FixtureAdapter())
+
+    return None
+
+
+def time_it(func, runs):
+
+    timings = []
+
+    # the parsers print warnings about multiple matches, keep them out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(runs):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+    return {
+        'runs': runs,
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.mean(timings),
+    }
+
+
+def season(n_events, n_players):
+
+    events = [
+        Event(name=f'Benchmark Open {i}', url=f'https://www.pdga.com/tour/event/{70000 + i}', year=2023, fast=True)
+        for i in range(n_events)
+    ]
+
+    registry = PlayerRegistry()
+    registry.add_event(events[0])
+
+    players = [Player(url=link, registry=registry) for link in players_links_list()[:n_players]]
+
+    return events, players
+
+
+def name_index():
+
+    # the ranking fixture plus the 2023 fields saved in csv_results
+    index = PlayerNameIndex.from_sources()
+
+    for file_name in sorted(os.listdir(CSV_RESULTS)):
+        results_df = pd.read_csv(os.path.join(CSV_RESULTS, file_name), index_col=0)
+        for pdga_number, name in zip(results_df['PDGA Number'], results_df['Player']):
+            index.add(pdga_number, name)
+
+    return index
+
+
+def check_name_index(index):
+
+    # a wrong match here skips the PDGA search for good, so anything short
+    # of unambiguous has to come back as None
+    expected = {
+        'Simon Lizotte': 8332,
+        'simon lizote': 8332,
+        'Calvin Heimberg': 45971,
+        'Nick Robinson': 60332,
+        'Jones': None,
+        'Klein': None,
+        'Rick Robinson': None,
+        'Nick Robison': None,
+    }
+
+    for name, pdga_number in expected.items():
+        found = index.find(name)
+        assert found == pdga_number, f'{name!r} found {found}, expected {pdga_number}'
+
+    for pdga_number, name in index.names.items():
+        assert index.find(name) in (pdga_number, None), f'{name!r} found another player'
+
+    return None
+
+
+def benchmarks(n_events=20, n_players=150):
+
+    event_url = 'https://www.pdga.com/tour/event/71315'
+    event = Event(name='USDGC', url=event_url, year=2023)
+    event_search = EventSearch(event='USDGC', date_filter_min='2023-01-01', date_filter_max='2023-12-31', tier=['ES', 'M'], classification=['Pro'])
+    player_search = PlayerSearch(first_name='Simon', last_name='Lizotte')
+
+    # the searches release their page once resolved; load it back once here
+    # so the timings below cover parsing only, as they always have
+    event_search.load()
+    player_search.load()
+
+    soup = soupify(event_url)
+    rows = soup.select('div[class*="leaderboard"]')[0].select('tr[class*="odd"], tr[class*="even"]')
+
+    events, players = season(n_events, n_players)
+    index = SeasonIndex(events)
+    season_rows = [row for e in events for row in e.results_df.to_dict('records')]
+
+    names = name_index()
+    check_name_index(names)
+    indexed_names = list(names.names.values())
+
+    def fantasy_scores(index=None):
+        for player in players:
+            player.player_results = {2023: {}}
+            for e in events:
+                player.fantasy_score(e, index=index)
+
+    return {
+        'soupify': (lambda: soupify(event_url), 10),
+        'event_parser': (lambda: event.event_parser(event_url), 10),
+        'event_parser_fast': (lambda: event.event_parser(event_url, fast=True), 10),
+        'row_parser': (lambda: [event.row_parser(row) for row in rows], 10),
+        'EventSearch.parser': (event_search.parser, 50),
+        'PlayerSearch.parser': (player_search.parser, 50),
+        'insert_data_season': (lambda: insert_data('Benchmark', event_table_dict(), season_rows), 5),
+        'fantasy_score_season': (fantasy_scores, 3),
+        'fantasy_score_season_indexed': (lambda: fantasy_scores(index), 5),
+        'score_season': (lambda: score_season(events, players), 5),
+        'PlayerNameIndex.find': (lambda: [names.find(name) for name in indexed_names], 5),
+    }
+
+
+def git_commit():
+
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=BENCHMARKS, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(previous, current):
+
+    print(f'\n{"benchmark":<30} {"before":>10} {"after":>10} {"change":>8}')
+
+    for name, result in current['results'].items():
+        if name not in previous['results']:
+            continue
+        before = previous['results'][name]['median']
+        after = result['median']
+        print(f'{name:<30} {before * 1000:>8.2f}ms {after * 1000:>8.2f}ms {after / before:>7.2f}x')
+
+    return None
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description='Time the scraping, parsing and scoring hot paths against recorded fixtures.')
+    parser.add_argument('--only', nargs='+', help='run only these benchmarks')
+    parser.add_argument('--runs', type=int, help='override the number of runs per benchmark')
+    parser.add_argument('--events', type=int, default=20)
+    parser.add_argument('--players', type=int, default=150)
+    parser.add_argument('--output', help='JSON file to write (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', help='a previous results JSON to compare against')
+    args = parser.parse_args()
+
+    use_fixtures()
+
+    results = {}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        suite = benchmarks(args.events, args.players)
+
+    for name, (func, runs) in suite.items():
+        if args.only and name not in args.only:
+            continue
+        results[name] = time_it(func, args.runs or runs)
+        print(f'{name:<30} {results[name]["median"] * 1000:>10.2f} ms (median of {results[name]["runs"]})')
+
+    report = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'lxml': functions.lxml is not None,
+        'events': args.events,
+        'players': args.players,
+        'results': results,
+    }
+
+    output = args.output or os.path.join(RESULTS, f'{report["commit"]}.json')
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f'\n{output} has been saved.')
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+    return None
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,12 @@
-from dg_fantasy_functions import events_list, Event
+from functions import events_list, scrape_events, configure_rate_limit
 
 
-event_details = events_list(2023)
+# at most 2 requests/second across all workers, up to 8 in flight
+configure_rate_limit(rate=2)
 
-events = []
-events_errors = []
+event_details = events_list(2023)
 
-for event_name,link in event_details:
-	
-    try:
-        events.append(Event(name=event_name, url=link))
-    except:
-        print(link)
-        events_errors.append(link)
+events, events_errors = scrape_events(event_details, workers=8)
 
-    time.sleep(1)
\ No newline at end of file
+for error in events_errors:
+    print(f"{error['item'][1]}: {error['error']} ({error['message']})")
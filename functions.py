@@ -1,620 +1,3852 @@
 import requests
 from bs4 import BeautifulSoup as bs
+from bs4 import SoupStrainer, UnicodeDammit
 import pandas as pd
+import numpy as np
 import itertools
 from datetime import date as dt
+from datetime import datetime
 import re
+import io
+import sys
+import csv
+import os
+import json
+import hashlib
 import pickle
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import random
+import multiprocessing
+import threading
+import time
+import types
+import atexit
+import bisect
+import heapq
+import unicodedata
+from collections import namedtuple, OrderedDict
+from requests.adapters import HTTPAdapter
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:
+    pa = None
+    ds = None
+
+try:
+    import lxml.html
+    _fast_parser = 'lxml'
+except ImportError:
+    lxml = None
+    _fast_parser = 'html.parser'
+
+try:
+    import brotli
+    _accept_encoding = 'gzip, deflate, br'
+except ImportError:
+    _accept_encoding = 'gzip, deflate'
+
+
+def metric_buckets():
+
+    seconds = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
 
+    return {
+        'dg_fantasy_request_seconds': seconds,
+        'dg_fantasy_stage_seconds': seconds,
+        'dg_fantasy_response_bytes': tuple(1024 * 4 ** i for i in range(8)),
+    }
+
+
+class _NullTimer:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_null_timer = _NullTimer()
+
+
+class _Timer:
+
+    def __init__(self, metrics, name, labels):
+
+        self._metrics = metrics
+        self._name = name
+        self._labels = labels
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._metrics.observe(self._name, time.perf_counter() - self._start, **self._labels)
+        return False
+
+
+class Metrics:
+
+    def __init__(self, enabled=False):
+
+        self.enabled = enabled
+        self.counters = {}
+        self.histograms = {}
+        self._buckets = metric_buckets()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'Metrics(enabled={self.enabled}, counters={len(self.counters)}, histograms={len(self.histograms)})'
+
+    def inc(self, name, value=1, **labels):
+
+        if not self.enabled:
+            return None
+
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+        return None
+
+    def observe(self, name, value, **labels):
+
+        if not self.enabled:
+            return None
+
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        buckets = self._buckets.get(name, self._buckets['dg_fantasy_stage_seconds'])
+
+        with self._lock:
+            histogram = self.histograms.get(key)
+
+            if histogram is None:
+                histogram = self.histograms[key] = {'buckets': [0] * (len(buckets) + 1), 'sum': 0, 'count': 0}
+
+            # counts are per bucket here and made cumulative on export
+            histogram['buckets'][bisect.bisect_left(buckets, value)] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+
+        return None
+
+    def timer(self, name='dg_fantasy_stage_seconds', **labels):
+
+        if not self.enabled:
+            return _null_timer
+
+        return _Timer(self, name, labels)
+
+    def reset(self):
+
+        with self._lock:
+            self.counters = {}
+            self.histograms = {}
+
+        return None
+
+    def _label_string(self, labels, extra=()):
+
+        labels = tuple(labels) + tuple(extra)
+
+        if not labels:
+            return ''
+
+        return '{' + ','.join([f'{k}="{v}"' for k, v in labels]) + '}'
+
+    def prometheus(self):
+
+        lines = []
+
+        with self._lock:
+            for name in sorted({key[0] for key in self.counters}):
+                lines.append(f'# TYPE {name} counter')
+                for (_name, labels), value in sorted(self.counters.items()):
+                    if _name == name:
+                        lines.append(f'{name}{self._label_string(labels)} {value}')
+
+            for name in sorted({key[0] for key in self.histograms}):
+                buckets = self._buckets.get(name, self._buckets['dg_fantasy_stage_seconds'])
+                lines.append(f'# TYPE {name} histogram')
+
+                for (_name, labels), histogram in sorted(self.histograms.items()):
+                    if _name != name:
+                        continue
+
+                    cumulative = 0
+                    for bound, count in zip(list(buckets) + ['+Inf'], histogram['buckets']):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{self._label_string(labels, [("le", bound)])} {cumulative}')
+
+                    lines.append(f'{name}_sum{self._label_string(labels)} {histogram["sum"]}')
+                    lines.append(f'{name}_count{self._label_string(labels)} {histogram["count"]}')
+
+        return '\n'.join(lines) + '\n'
+
+    def to_dict(self):
+
+        with self._lock:
+            return {
+                'counters': [
+                    {'name': name, 'labels': dict(labels), 'value': value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+                'histograms': [
+                    {
+                        'name': name,
+                        'labels': dict(labels),
+                        'buckets': list(self._buckets.get(name, self._buckets['dg_fantasy_stage_seconds'])),
+                        'counts': list(histogram['buckets']),
+                        'sum': histogram['sum'],
+                        'count': histogram['count'],
+                    }
+                    for (name, labels), histogram in sorted(self.histograms.items())
+                ],
+            }
+
+    def dump(self, json_path=None, prometheus_path=None):
+
+        if json_path:
+            with open(json_path, 'w') as f:
+                json.dump(self.to_dict(), f, indent=2)
+
+        if prometheus_path:
+            with open(prometheus_path, 'w') as f:
+                f.write(self.prometheus())
+
+        return None
+
+
+metrics = Metrics()
+_metrics_dump_paths = {}
+
+
+def dump_metrics():
+
+    if _metrics_dump_paths:
+        metrics.dump(**_metrics_dump_paths)
+
+    return None
+
+
+def configure_metrics(enabled=True, json_path=None, prometheus_path=None):
+
+    metrics.enabled = enabled
+
+    # end-of-run dump for the nightly scrape; registered once, later calls
+    # only change where it writes
+    if json_path or prometheus_path:
+        if not _metrics_dump_paths:
+            atexit.register(dump_metrics)
+        _metrics_dump_paths.update(json_path=json_path, prometheus_path=prometheus_path)
+
+    return None
+
+
+def session_settings():
+
+    return {
+        'timeout': (5, 30),
+        'retries': 4,
+        'backoff': 0.5,
+        'backoff_max': 30,
+        'retry_statuses': (429, 500, 502, 503, 504),
+        'pool_connections': 4,
+        'pool_maxsize': 8,
+        'user_agent': 'dg_fantasy',
+    }
+
+
+_session = None
+_session_lock = threading.Lock()
+_settings = session_settings()
+
+
+def configure_session(**kwargs):
+
+    global _session
+
+    _unknown = [x for x in kwargs.keys() if x not in _settings]
+
+    if _unknown:
+        raise KeyError(f"Unknown session setting(s): {', '.join(_unknown)}")
+
+    with _session_lock:
+        _settings.update(kwargs)
+
+        if _session is not None:
+            _session.close()
+            _session = None
+
+    return None
+
+
+def get_session():
+
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+
+                # pool_maxsize caps the open connections per host, pool_block
+                # makes extra threads wait for one instead of opening more
+                adapter = HTTPAdapter(
+                    pool_connections=_settings['pool_connections'],
+                    pool_maxsize=_settings['pool_maxsize'],
+                    pool_block=True,
+                    max_retries=0
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+
+                session.headers.update({
+                    'Accept-Encoding': _accept_encoding,
+                    'User-Agent': _settings['user_agent'],
+                })
+
+                _session = session
+
+    return _session
+
+
+class TokenBucket:
+
+    def __init__(self, rate=2, capacity=None):
+
+        self.rate = float(rate)
+        self.capacity = float(capacity or rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'TokenBucket(rate={self.rate}, capacity={self.capacity})'
+
+    def acquire(self):
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return None
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+# shared by every thread that goes through fetch(), so the ceiling is global
+_rate_limiter = TokenBucket(rate=2, capacity=2)
+
+
+def configure_rate_limit(rate=2, capacity=None):
+
+    global _rate_limiter
+
+    _rate_limiter = TokenBucket(rate=rate, capacity=capacity)
+
+    return None
+
+
+def backoff_delay(attempt, retry_after=None):
+
+    if retry_after:
+        try:
+            return min(float(retry_after), _settings['backoff_max'])
+        except ValueError:
+            pass
+
+    # "full jitter": anywhere between 0 and the exponential ceiling
+    ceiling = min(_settings['backoff_max'], _settings['backoff'] * 2 ** attempt)
+
+    return random.uniform(0, ceiling)
+
+
+def fetch(url, headers=None, timeout=None):
+
+    session = get_session()
+    timeout = timeout or _settings['timeout']
+    retries = _settings['retries']
+
+    for attempt in range(retries + 1):
+
+        _rate_limiter.acquire()
+
+        try:
+            with metrics.timer('dg_fantasy_request_seconds'):
+                page = session.get(url, headers=headers, timeout=timeout)
+
+        except (requests.ConnectionError, requests.Timeout) as e:
+            metrics.inc('dg_fantasy_requests_total', status=type(e).__name__)
+            if attempt == retries:
+                raise
+            metrics.inc('dg_fantasy_request_retries_total')
+            time.sleep(backoff_delay(attempt))
+            continue
+
+        if metrics.enabled:
+            metrics.inc('dg_fantasy_requests_total', status=page.status_code)
+            metrics.observe('dg_fantasy_response_bytes', len(page.content))
+
+        if page.status_code in _settings['retry_statuses'] and attempt < retries:
+            metrics.inc('dg_fantasy_request_retries_total')
+            time.sleep(backoff_delay(attempt, page.headers.get('Retry-After')))
+            continue
+
+        page.raise_for_status()
+
+        return page
+
+
+def event_is_complete(content):
+
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', errors='ignore')
+
+    return bool(re.search(r'Event complete', content, re.IGNORECASE))
+
+
+def cache_ttl_rules():
+
+    # first matching pattern wins; a ttl of None never expires and a callable
+    # decides from the page body when it is stored
+    return [
+        (r'/tour/event/', lambda content: None if event_is_complete(content) else 15 * 60),
+        (r'/united-states-tour-ranking-open', 15 * 60),
+        (r'/tour/search', 60 * 60),
+        (r'/players\?', 24 * 60 * 60),
+        (r'/player/', 24 * 60 * 60),
+    ]
+
+
+class ResponseCache:
+
+    def __init__(
+        self,
+        directory='.http_cache',
+        max_bytes=500 * 1024 ** 2,
+        rules=None,
+        default_ttl=60 * 60
+    ):
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.rules = [(re.compile(p), ttl) for p, ttl in (rules or cache_ttl_rules())]
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __repr__(self):
+        return f'ResponseCache({self.directory!r}, max_bytes={self.max_bytes})'
+
+    def _paths(self, url):
+
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        folder = os.path.join(self.directory, key[:2])
+
+        return os.path.join(folder, key + '.json'), os.path.join(folder, key + '.body')
+
+    def ttl(self, url, content):
+
+        for pattern, ttl in self.rules:
+            if pattern.search(url):
+                return ttl(content) if callable(ttl) else ttl
+
+        return self.default_ttl
+
+    def get(self, url):
+
+        meta_path, body_path = self._paths(url)
+
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+
+        # mtime of the metadata file doubles as the LRU clock
+        os.utime(meta_path)
+
+        return meta, body
+
+    def is_fresh(self, meta):
+
+        return meta['expires'] is None or time.time() < meta['expires']
+
+    def conditional_headers(self, meta):
+
+        headers = {}
+
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+        return headers
+
+    def _write(self, path, data, mode='wb'):
+
+        tmp_path = f'{path}.{threading.get_ident()}.tmp'
+
+        with open(tmp_path, mode) as f:
+            f.write(data)
+
+        os.replace(tmp_path, path)
+
+        return None
+
+    def _write_meta(self, url, meta):
+
+        meta_path, _ = self._paths(url)
+        self._write(meta_path, json.dumps(meta), mode='w')
+
+        return None
+
+    def store(self, url, page):
+
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+
+        body = page.content
+        ttl = self.ttl(url, body)
+        now = time.time()
+
+        try:
+            previous_size = os.path.getsize(body_path)
+        except OSError:
+            previous_size = 0
+
+        meta = {
+            'url': url,
+            'sha256': hashlib.sha256(body).hexdigest(),
+            'size': len(body),
+            'etag': page.headers.get('ETag'),
+            'last_modified': page.headers.get('Last-Modified'),
+            'fetched_at': now,
+            'expires': None if ttl is None else now + ttl,
+        }
+
+        self._write(body_path, body)
+        self._write_meta(url, meta)
+
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += meta['size'] - previous_size
+
+        self.evict()
+
+        return meta
+
+    def refresh(self, url, meta, page, body):
+
+        ttl = self.ttl(url, body)
+        now = time.time()
+
+        meta['etag'] = page.headers.get('ETag', meta.get('etag'))
+        meta['last_modified'] = page.headers.get('Last-Modified', meta.get('last_modified'))
+        meta['fetched_at'] = now
+        meta['expires'] = None if ttl is None else now + ttl
+
+        self._write_meta(url, meta)
+
+        return meta
+
+    def _entries(self):
+
+        entries = []
+
+        for folder, _, files in os.walk(self.directory):
+            for file_name in files:
+                if file_name.endswith('.json'):
+                    meta_path = os.path.join(folder, file_name)
+                    body_path = meta_path[:-len('.json')] + '.body'
+                    try:
+                        size = os.path.getsize(body_path)
+                        entries.append((os.path.getmtime(meta_path), size, meta_path, body_path))
+                    except OSError:
+                        pass
+
+        return entries
+
+    def evict(self):
+
+        with self._lock:
+
+            if self._total_bytes is None:
+                self._total_bytes = sum(x[1] for x in self._entries())
+
+            if self._total_bytes <= self.max_bytes:
+                return None
+
+            # least recently used first, down to 90% so we don't evict on every store
+            target = self.max_bytes * 0.9
+
+            for _, size, meta_path, body_path in sorted(self._entries()):
+                if self._total_bytes <= target:
+                    break
+
+                for path in (meta_path, body_path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+                self._total_bytes -= size
+
+        return None
+
+    def clear(self):
+
+        with self._lock:
+            for _, _, meta_path, body_path in self._entries():
+                for path in (meta_path, body_path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+            self._total_bytes = 0
+
+        return None
+
+
+_response_cache = None
+_cache_settings = {'enabled': True, 'directory': '.http_cache', 'max_bytes': 500 * 1024 ** 2}
+
+
+def configure_cache(**kwargs):
+
+    global _response_cache
+
+    _cache_settings.update(kwargs)
+    _response_cache = None
+
+    return None
+
+
+def get_cache():
+
+    global _response_cache
+
+    if _response_cache is None and _cache_settings['enabled']:
+        with _session_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache(
+                    directory=_cache_settings['directory'],
+                    max_bytes=_cache_settings['max_bytes']
+                )
+
+    return _response_cache
+
+
+def fetch_content(url):
+
+    cache = get_cache()
+
+    if cache is None:
+        return fetch(url).content
+
+    cached = cache.get(url)
+
+    if cached:
+        meta, body = cached
+
+        if cache.is_fresh(meta):
+            metrics.inc('dg_fantasy_cache_total', result='hit')
+            return body
+
+        page = fetch(url, headers=cache.conditional_headers(meta))
+
+        if page.status_code == 304:
+            metrics.inc('dg_fantasy_cache_total', result='revalidated')
+            cache.refresh(url, meta, page, body)
+            return body
+
+        metrics.inc('dg_fantasy_cache_total', result='stale')
+
+    else:
+        metrics.inc('dg_fantasy_cache_total', result='miss')
+        page = fetch(url)
+
+    cache.store(url, page)
+
+    return page.content
+
+
+def soupify(url, fast=False, parse_only=None):
+    content = fetch_content(url)
+    with metrics.timer(stage='soupify'):
+        if fast:
+            soup = bs(content, _fast_parser, parse_only=parse_only)
+        else:
+            soup = bs(content, "html.parser")
+    return soup
+
+
+def class_contains(substring):
+
+    return SoupStrainer(class_=lambda c: c is not None and substring in c)
+
+
+def event_row_columns():
+
+    # (key, class substring) in the order Event.row_parser looks cells up
+    return [
+        ('Place', 'place'),
+        ('Player', 'player'),
+        ('PDGA Number', 'pdga-number'),
+        ('Player Rating', 'player-rating'),
+        ('par', 'par'),
+        ('dnf', 'dnf'),
+    ]
+
+
+def fast_row_parser(cells, columns):
+
+    # one pass over the row's cells, each column takes the first cell whose
+    # class contains its substring (same as select_one per column)
+    found = {}
+
+    for cell_class, cell_text in cells:
+        for key, substring in columns:
+            if key not in found and substring in cell_class:
+                found[key] = cell_text
+
+    if 'par' in found:
+        score = found['par']
+    elif 'dnf' in found:
+        score = 'DNF'
+    else:
+        score = 'ERROR'
+
+    return (
+        int(found['Place']),
+        found['Player'],
+        int(found['PDGA Number']),
+        int(found['Player Rating']),
+        score,
+    )
+
+
+def interleave_rows(odd_rows, even_rows):
+
+    return (x for x in itertools.chain.from_iterable(itertools.zip_longest(odd_rows, even_rows)) if x is not None)
+
+
+def iter_event_rows(content):
+
+    # yields (Place, Player, PDGA Number, Player Rating, Score) tuples in
+    # event_table_dict() order without materialising the table
+    columns = event_row_columns()
+
+    if lxml is not None:
+        # lxml assumes latin-1 for bytes without a meta charset, bs4 doesn't
+        if isinstance(content, bytes):
+            content = UnicodeDammit(content, ['utf-8']).unicode_markup
+
+        document = lxml.html.fromstring(content)
+        leaderboard = document.xpath('//div[contains(@class, "leaderboard")]')[0]
+        table = leaderboard.xpath('.//div[contains(@class, "table-container")]')[0]
+        odd_rows = (row for row in table.iter('tr') if 'odd' in (row.get('class') or ''))
+        even_rows = (row for row in table.iter('tr') if 'even' in (row.get('class') or ''))
+
+        count = 0
+
+        for count, row in enumerate(interleave_rows(odd_rows, even_rows), start=1):
+            yield fast_row_parser(
+                [(td.get('class') or '', td.text_content()) for td in row.iter('td')],
+                columns
+            )
+
+        metrics.inc('dg_fantasy_rows_parsed_total', count, source='event')
+
+        return
+
+    soup = bs(content, _fast_parser, parse_only=class_contains('leaderboard'))
+    table = soup.select('div[class*="table-container"]')[0]
+    odd_rows = table.select('tr[class*="odd"]')
+    even_rows = table.select('tr[class*="even"]')
+
+    count = 0
+
+    for count, row in enumerate(interleave_rows(odd_rows, even_rows), start=1):
+        yield fast_row_parser(
+            [(' '.join(td.get('class', [])), td.text) for td in row.find_all('td')],
+            columns
+        )
+
+    metrics.inc('dg_fantasy_rows_parsed_total', count, source='event')
+
+
+def fast_event_rows(content):
+
+    column_names = list(event_table_dict().keys())
+
+    return [dict(zip(column_names, row)) for row in iter_event_rows(content)]
+
+
+def event_date_parser(content):
+
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', errors='ignore')
+
+    # "Date: 10-Mar to 12-Mar-2023" or "Date: 12-Mar-2023" (label sometimes
+    # in <strong>), the end date is the full one
+    date_line = re.search(r'Date(?:</strong>)?\s*:(.{0,60})', content)
+
+    if not date_line:
+        return None
+
+    dates = re.findall(r'\d{1,2}-[A-Za-z]{3}-\d{4}', date_line.group(1))
+
+    if not dates:
+        return None
+
+    return datetime.strptime(dates[-1], '%d-%b-%Y').date()
+
+
+def player_profile_parser(content):
+
+    _soup = bs(content, "html.parser")
+
+    try:
+        _name_raw = _soup.select('div[class*="pane-page-title"]')[0].text.strip()
+    except IndexError:
+        _name_raw = re.findall(r'<h1>(.+) #\d{1,7}<\/h1>', str(_soup))[0]
+    official_name = _name_raw.split('#')[0].strip()
+    rating_raw = _soup.select('li[class*="rating"]')[0].text.strip()
+    rating = int(re.findall(r' (\d{3,4}) ', rating_raw)[0])
+
+    return official_name, rating
+
+
+def events_list(
+        year,
+        tier=['ES', 'M'], 
+        classification=['Pro'],
+        base_url='https://www.pdga.com/tour/search',
+    ):
+
+    catalog, errors = discover_events(year, tier=tier, classification=classification, base_url=base_url)
+
+    if errors:
+        raise RuntimeError(f"{len(errors)} search page(s) failed, first: {errors[0]['item']} ({errors[0]['message']})")
+
+    events_with_links = [(event.name, event.url) for event in catalog]
+
+    return events_with_links
+
+
+# date first so a catalog sorts chronologically
+EventRecord = namedtuple(
+    'EventRecord',
+    ['date', 'name', 'pdga_event_number', 'url', 'tier', 'classification', 'location', 'year']
+)
+
+
+def event_search_url(year, tier=['ES', 'M'], classification=['Pro'], base_url='https://www.pdga.com/tour/search', page=0):
+
+    tier_str = '&'.join([f'Tier[]={t}' for t in tier])
+    classification_str = '&'.join([f'Classification[]={c}' for c in classification])
+    url = f'{base_url}?date_filter[min][date]={year}-01-01&date_filter[max][date]={year}-12-31&{tier_str}&{classification_str}'
+
+    if page:
+        url += f'&page={page}'
+
+    return url
+
+
+def search_date_parser(text, year):
+
+    # "14-Jan-2023", or "06-Oct to 09-Oct-2023" for multi-day events
+    found = re.search(r'(\d{1,2})-([A-Za-z]{3})(?:-(\d{4}))?', text)
+    years = re.findall(r'\d{4}', text)
+
+    if not found:
+        return dt(year, 1, 1)
+
+    day, month, _year = found.groups()
+
+    try:
+        return datetime.strptime(f'{day}-{month}-{_year or (years[-1] if years else year)}', '%d-%b-%Y').date()
+    except ValueError:
+        return dt(year, 1, 1)
+
+
+def event_search_parser(content, year, _base_url='https://www.pdga.com'):
+
+    # returns the page's events and the index of the last results page
+    soup = bs(content, _fast_parser)
+    records = []
+
+    for row in soup.select('tr'):
+        link = row.select_one('a[href*="/tour/event/"]')
+        if link is None or not link.text:
+            continue
+
+        def cell(field):
+            found = row.select_one(f'td[class*="views-field-{field}"]')
+            return found.text.strip() if found is not None else None
+
+        url = _base_url + link['href']
+        records.append(EventRecord(
+            date=search_date_parser(cell('StartDate') or '', year),
+            name=link.text,
+            pdga_event_number=int(url.rstrip('/').split('/')[-1]),
+            url=url,
+            tier=cell('Tier'),
+            classification=cell('Classification'),
+            location=cell('Location'),
+            year=year,
+        ))
+
+    pages = [int(x) for a in soup.select('a[href*="page="]') for x in re.findall(r'[?&]page=(\d+)', a['href'])]
+
+    return records, max(pages, default=0)
+
+
+def discover_events(
+        years,
+        tier=['ES', 'M'],
+        classification=['Pro'],
+        base_url='https://www.pdga.com/tour/search',
+        workers=8,
+    ):
+
+    # years is one year or any iterable of them; the first page of every
+    # year goes out at once, then whatever further pages those report.
+    # Every request shares the module rate limit through fetch().
+    years = [years] if isinstance(years, int) else list(years)
+    pages = {}
+
+    def load(item):
+        year, page = item
+        content = fetch_content(event_search_url(year, tier, classification, base_url, page))
+        pages[item] = event_search_parser(content, year)
+        return item
+
+    with metrics.timer(stage='discover_events'):
+        _, errors = scrape_all(load, [(year, 0) for year in years], workers=workers)
+        more = [(year, page) for year in years if (year, 0) in pages for page in range(1, pages[(year, 0)][1] + 1)]
+        _, more_errors = scrape_all(load, more, workers=workers)
+
+    errors = [
+        dict(error, item=event_search_url(error['item'][0], tier, classification, base_url, error['item'][1]))
+        for error in errors + more_errors
+    ]
+
+    # an event can show up on two pages or in two years' searches
+    catalog = {}
+
+    for item in sorted(pages):
+        for record in pages[item][0]:
+            catalog.setdefault(record.pdga_event_number, record)
+
+    return sorted(catalog.values()), errors
+
+
+def ranking_players(
+        base_url='https://www.pdga.com/united-states-tour-ranking-open',
+    ):
+
+    # (name, link) for everyone on the ranking page, names from the link text
+    soup = soupify(base_url)
+    table = soup.select('div[class*="table"]')[0]
+    player_data = table.select('a[class*="player-profile-link"]')
+    # player_data = table.select('a[href*="/player/"]')
+    players = [
+        (p.text.strip(), 'https://www.pdga.com'+p['href']) for p in player_data if p.text.strip()
+    ]
+
+    return players
+
+
+def players_links_list(
+        base_url='https://www.pdga.com/united-states-tour-ranking-open',
+    ):
+
+    players_links = [link for name, link in ranking_players(base_url)]
+
+    return players_links
+
+
+def type_check(item, _type):
+    if type(item) != _type:
+        raise TypeError(f'{item} must be type {_type}')
+    else:
+        pass
+
+
+def table_exists(table_name):
+
+    table_exists_query = f"""SELECT 1
+FROM information_schema.tables
+WHERE table_name='{table_name}'"""
+
+    return table_exists_query
+
+
+def create_table(table_name, table_columns):
+
+    columns_list = [f'"{column}" {datatype}' for column,datatype in table_columns.items()]
+    columns_query = ',\n\t'.join(columns_list)
+
+    create_table_query = f'''CREATE TABLE "{table_name}" (
+    {columns_query}
+);'''
+
+    return create_table_query
+
+
+def insert_data(table_name, table_columns, data, truncate=True):
+
+    with metrics.timer(stage='insert_data'):
+        return _insert_data(table_name, table_columns, data, truncate)
+
+
+def _insert_data(table_name, table_columns, data, truncate=True):
+
+    column_names = table_columns.keys()
+
+    insert_list = []
+
+    for i,_dict in enumerate(data):
+
+        data_to_insert = []
+
+        for column_name,datum in _dict.items():
+            if "varchar" in table_columns[column_name]:
+                datum = "'" + datum.replace("'", "''") + "'"
+
+            data_to_insert.append(str(datum))
+
+        insert_list.append('(' + ','.join(data_to_insert) + ')')
+
+    metrics.inc('dg_fantasy_rows_rendered_total', len(insert_list), table=table_name)
+
+    insert_values = '\n\t,'.join(insert_list) + '\n;'
+
+    if truncate:
+
+        insert_query = f'''TRUNCATE TABLE "{table_name}";
+
+'''
+
+    else:
+        insert_query = ''
+
+    insert_query += f'''INSERT INTO "{table_name}" ({",".join([f'"{column}"' for column in column_names])})
+VALUES {insert_values}'''
+
+    return insert_query
+
+
+def sql_rows(table_columns, data):
+
+    column_names = list(table_columns.keys())
+
+    if isinstance(data, pd.DataFrame):
+        frame = data[column_names].copy()
+
+        # integer columns with missing values come back from pandas as floats
+        for column_name, datatype in table_columns.items():
+            if 'int' in datatype and frame[column_name].dtype.kind == 'f':
+                frame[column_name] = frame[column_name].astype('Int64')
+
+        frame = frame.astype(object)
+        frame = frame.where(frame.notna(), None)
+        return frame.itertuples(index=False, name=None)
+
+    if isinstance(data, dict):
+        data = [data]
+
+    def rows():
+        for row in data:
+            if isinstance(row, dict):
+                row = tuple(row[column_name] for column_name in column_names)
+            # scalar check only: pd.NA has no truth value and lists aren't missing
+            yield tuple(None if datum is None or (pd.api.types.is_scalar(datum) and pd.isna(datum)) else datum for datum in row)
+
+    return rows()
+
+
+def write_rows_csv(rows, file_path, table_columns):
+
+    # same layout as DataFrame.to_csv, index column included
+    count = 0
+
+    with open(file_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow([''] + list(table_columns.keys()))
+
+        for count, row in enumerate(rows, start=1):
+            writer.writerow((count - 1,) + tuple(row))
+
+    return count
+
+
+def csv_field(datum):
+
+    # COPY's csv format reads an unquoted empty field as NULL and a quoted
+    # one as an empty string
+    if datum is None:
+        return ''
+    if isinstance(datum, str):
+        return '"' + datum.replace('"', '""') + '"'
+    return str(datum)
+
+
+class CopyStream(io.TextIOBase):
+
+    # file-like view over an iterator of rows, rendered as CSV a page at a
+    # time so COPY never sees the whole batch in memory
+
+    def __init__(self, rows, page_size=5000):
+
+        self._rows = iter(rows)
+        self._page_size = page_size
+        self._buffer = ''
+
+    def readable(self):
+        return True
+
+    def _fill(self):
+
+        added = ''.join([
+            ','.join([csv_field(datum) for datum in row]) + '\n'
+            for row in itertools.islice(self._rows, self._page_size)
+        ])
+        self._buffer += added
+
+        return bool(added)
+
+    def read(self, size=-1):
+
+        if size is None or size < 0:
+            while self._fill():
+                pass
+            size = len(self._buffer)
+
+        else:
+            while len(self._buffer) < size and self._fill():
+                pass
+
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+
+        return chunk
+
+    def readline(self, size=-1):
+
+        while '\n' not in self._buffer and self._fill():
+            pass
+
+        end = self._buffer.find('\n') + 1 or len(self._buffer)
+        line, self._buffer = self._buffer[:end], self._buffer[end:]
+
+        return line
+
+
+def counted(rows, name, **labels):
+
+    count = 0
+
+    for count, row in enumerate(rows, start=1):
+        yield row
+
+    metrics.inc(name, count, **labels)
+
+
+def copy_data(executor, table_name, table_columns, data, truncate=True, method='copy', page_size=5000):
+
+    columns = ','.join([f'"{column}"' for column in table_columns.keys()])
+    rows = sql_rows(table_columns, data)
+
+    if metrics.enabled:
+        rows = counted(rows, 'dg_fantasy_rows_written_total', table=table_name, method=method)
+
+    if truncate:
+        executor.execute(f'TRUNCATE TABLE "{table_name}";')
+
+    if method == 'copy':
+        with metrics.timer(stage='copy_data'):
+            executor.copy_expert(
+                f'COPY "{table_name}" ({columns}) FROM STDIN WITH (FORMAT csv)',
+                CopyStream(rows, page_size=page_size)
+            )
+
+    elif method == 'values':
+        with metrics.timer(stage='copy_data'):
+            psycopg2.extras.execute_values(
+                executor,
+                f'INSERT INTO "{table_name}" ({columns}) VALUES %s',
+                rows,
+                page_size=page_size
+            )
+
+    else:
+        raise ValueError(f"method must be 'copy' or 'values', not {method!r}")
+
+    return None
+
+
+def player_table_dict():
+
+    return {
+        'Name': 'varchar(200)',
+        'PDGA Number': 'bigint',
+        'Event Name': 'varchar(500)',
+        'Place': 'int',
+        'Event Year': 'int',
+        'Event Status': 'varchar(50)'
+    }
+
+
+def event_table_dict():
+
+    return {
+        'Place': 'int',
+        'Player': 'varchar(200)',
+        'PDGA Number': 'bigint',
+        'Player Rating': 'int',
+        'Score': 'varchar(10)'
+    }
+
+
+def league_table_dict():
+
+    # a table can hold many leagues, so a team is keyed by (League Name, Team Name)
+    return {
+        'League Name': 'varchar(100)',
+        'Team Name': 'varchar(100)',
+        'Team Owner': 'varchar(100)',
+        'Number of Players': 'int',
+        'Number of Active Players': 'int',
+        'Wins': 'int',
+        'Losses': 'int',
+        'Ties': 'int',
+        'First Place': 'int',
+        'Second Place': 'int',
+        'Third Place': 'int',
+    }
+
+
+def add_league_name_column(table_name):
+
+    # league tables created before they were keyed by league
+    return f'ALTER TABLE "{table_name}" ADD COLUMN IF NOT EXISTS "League Name" varchar(100);'
+
+
+def results_dtypes():
+
+    return {
+        'Place': 'int16',
+        'Player': 'object',
+        'PDGA Number': 'int32',
+        'Player Rating': 'int16',
+        'Score': 'category',
+    }
+
+
+def compact_results(results_df):
+
+    if len(results_df) == 0:
+        return results_df
+
+    return results_df.astype(results_dtypes())
+
+
+def name_event(official_name, year):
+    _name = official_name.upper().split(' - ')[-1]
+    if 'PRESENT' in _name:
+        if 'PRESENTED' in _name:
+            event_name = _name.split('PRESENTED')[0].strip()
+        elif 'PRESENTS' in _name:
+            event_name = _name.split('PRESENTS')[-1].strip()
+
+    elif 'POWERED' in _name:
+        event_name = _name.split('POWERED')[0].strip()
+
+    else:
+        event_name = _name.strip()
+
+    event_name = event_name.replace(str(year), '').replace('PLAY IT AGAIN SPORTS', '').replace('  ', ' ').strip()
+
+    return f"{event_name}, {year}"
+
+
+def search_memo_key(search_string):
+
+    # PDGA searches ignore case and the constructors differ in how they
+    # title-case and escape names, so compare on a lowercased, escaped string
+    return search_string.strip().replace(' ', '%20').lower()
+
+
+class SearchMemo:
+
+    # name -> (url, official name, number) resolutions, newest last; entries
+    # expire after ttl seconds and the oldest go once max_entries is reached
+
+    def __init__(self, ttl=7 * 24 * 60 * 60, max_entries=10000, file_path=None):
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.file_path = file_path
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.file_path:
+            try:
+                with open(self.file_path) as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                data = {}
+
+            for key, (stored_at, value) in data.items():
+                self._entries[key] = (stored_at, tuple(value))
+
+    def __repr__(self):
+        return f'SearchMemo({len(self._entries)} entries, ttl={self.ttl}, max_entries={self.max_entries})'
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, search_string):
+
+        key = search_memo_key(search_string)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                metrics.inc('dg_fantasy_search_memo_total', result='miss')
+                return None
+
+            if self.ttl is not None and time.time() - entry[0] > self.ttl:
+                del self._entries[key]
+                metrics.inc('dg_fantasy_search_memo_total', result='expired')
+                return None
+
+            self._entries.move_to_end(key)
+
+        metrics.inc('dg_fantasy_search_memo_total', result='hit')
+
+        return entry[1]
+
+    def set(self, search_string, value):
+
+        with self._lock:
+            self._entries[search_memo_key(search_string)] = (time.time(), tuple(value))
+            self._entries.move_to_end(search_memo_key(search_string))
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return None
+
+    def clear(self):
+
+        with self._lock:
+            self._entries.clear()
+
+        return None
+
+    def save(self, file_path=None):
+
+        file_path = file_path or self.file_path
+        tmp_path = file_path + '.tmp'
+
+        with self._lock:
+            data = {key: [stored_at, list(value)] for key, (stored_at, value) in self._entries.items()}
+
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+
+        os.replace(tmp_path, file_path)
+
+        return None
+
+
+_search_memo = None
+_search_memo_settings = {'enabled': True, 'ttl': 7 * 24 * 60 * 60, 'max_entries': 10000, 'file_path': None}
+
+
+def save_search_memo():
+
+    # the atexit hook: saves whichever memo is current when the process exits
+    if _search_memo is not None and _search_memo.file_path:
+        _search_memo.save()
+
+    return None
+
+
+def configure_search_memo(**kwargs):
+
+    global _search_memo
+
+    # a persisted memo being replaced is saved now, since only the current
+    # one is saved at exit
+    save_search_memo()
+
+    _search_memo_settings.update(kwargs)
+    _search_memo = None
+
+    return None
+
+
+def get_search_memo():
+
+    global _search_memo
+
+    if _search_memo is None and _search_memo_settings['enabled']:
+        with _session_lock:
+            if _search_memo is None:
+                _search_memo = SearchMemo(
+                    ttl=_search_memo_settings['ttl'],
+                    max_entries=_search_memo_settings['max_entries'],
+                    file_path=_search_memo_settings['file_path']
+                )
+
+    return _search_memo
+
+
+atexit.register(save_search_memo)
+
+
+class Search:
+
+    __slots__ = (
+        '_search_type', 'fast', '_search_options', '_search_dict', '_base_url',
+        '_search_reqs', 'input', 'search_string', '_soup'
+    )
+
+    def __init__(self, search_type, fast=False, **kwargs):
+
+        self._search_type = search_type.title()
+        self.fast = fast
+
+        self._search_options = {
+            'Event': {
+                'base_url': 'https://www.pdga.com/tour/search',
+                'reqs': [
+                    'event',
+                    'date_filter_min',
+                    'date_filter_max',
+                    'tier',
+                    'classification'
+                ]
+            },
+            'Player': {
+                'base_url': 'https://www.pdga.com/players',
+                'reqs':  [
+                    'first_name',
+                    'last_name'
+                ]
+            }
+        }
+
+        self._search_dict = {
+            'event': {'url': 'OfficialName', 'type': str},
+            'date_filter_min': {'url': 'date_filter[min][date]', 'type': str},
+            'date_filter_max': {'url': 'date_filter[max][date]', 'type': str},
+            'tier': {'url': 'Tier[]', 'type': list},
+            'classification': {'url': 'Classification[]', 'type': list},
+            'first_name': {'url': 'FirstName', 'type': str},
+            'last_name': {'url': 'LastName', 'type': str}
+        }
+
+        self._base_url = self._search_options[self._search_type]['base_url']
+        self._search_reqs = self._search_options[self._search_type]['reqs']
+
+        _reqs_not_met = [x for x in self._search_reqs if x not in kwargs.keys()]
+
+        if _reqs_not_met:
+            if len(_reqs_not_met) == 1:
+                s = ''
+                is_are = 'is'
+            else:
+                s = 's'
+                is_are = 'are'
+
+            print(f"The following argument{s} {is_are} missing: {', '.join(reqs_not_met)}")
+
+        self.input = kwargs
+
+        self.search_string = self._base_url + '?'
+
+        _number_of_reqs = len(self._search_reqs)
+
+        for i, item in enumerate(self._search_reqs):
+
+            item_input = self.input[item]
+            item_url_term = self._search_dict[item]['url']
+            item_req_type = self._search_dict[item]['type']
+
+            type_check(item_input, item_req_type)
+
+            if item_req_type == list:
+                url_part = '&'.join([f'{item_url_term}={x}' for x in item_input])
+
+            elif item_req_type == str:
+                url_part = f'{item_url_term}={item_input}'
+
+            else:
+                print('Something went wrong with _search_reqs')
+
+            self.search_string += url_part.replace(' ','%20')
+
+            if i != _number_of_reqs - 1:
+                self.search_string += '&'
+
+        # the page is only fetched if the memo can't answer the search
+        self._soup = None
+
+
+    def load(self):
+
+        if self.fast:
+            self._soup = soupify(self.search_string, fast=True, parse_only=class_contains('table-container'))
+        else:
+            self._soup = soupify(self.search_string)
+
+        return self._soup
+
+
+    def resolve(self, parser):
+
+        memo = get_search_memo()
+        details = memo.get(self.search_string) if memo is not None else None
+
+        if details is None:
+            self.load()
+            details = parser()
+            if memo is not None:
+                memo.set(self.search_string, details)
+
+        # everything we need is in the details, don't hold on to the page
+        self._soup = None
+
+        return details
+
+
+    def parser_init(self):
+
+        # subclasses release the page once parsed, so fetch it again if asked
+        soup = self._soup if self._soup is not None else self.load()
+        table = soup.select('div[class*="table-container"]')[0]
+
+        odd_rows = table.select('tr[class*="odd"]')
+        even_rows = table.select('tr[class*="even"]')
+
+        rows = [x for x in itertools.chain.from_iterable(itertools.zip_longest(odd_rows,even_rows)) if x]
+        
+        return rows
+
+
+class EventSearch(Search):
+
+    __slots__ = ('_event_details', 'url', 'official_name', 'pdga_event_number')
+
+    def __init__(self, **kwargs):
+        Search.__init__(self, search_type='Event', **kwargs)
+
+        self._event_details = self.resolve(self.parser)
+        
+        self.url = self._event_details[0]
+        self.official_name = self._event_details[1]
+        self.pdga_event_number = self._event_details[2]
+
+
+    def parser(self, _base_url = 'https://www.pdga.com'):
+
+        rows = self.parser_init()
+
+        parsings = []
+        for row in rows:
+            if row.select('td[class*="views-field views-field-Classification"]')[0].text.strip() == 'Pro':
+                event_link = row.select('a[href*="/tour/event/"]')[0]
+                event_url = _base_url + event_link['href']
+                event_official_name = event_link.text
+                event_number = int(event_url.split('/')[-1])
+                parsings.append((event_url, event_official_name, event_number))
+                
+        if len(parsings) > 1:
+            print('There may be an issue as we parsed more than one item that matches.')
+
+        event = parsings[0]
+
+        return event[0], event[1], event[2]
+
+
+class PlayerSearch(Search):
+
+    __slots__ = ('_player_details', 'url', 'official_name', 'pdga_number')
+
+    def __init__(self, **kwargs):
+        Search.__init__(self, search_type='Player', **kwargs)
+
+        self._player_details = self.resolve(self.parser)
+        
+        self.url = self._player_details[0]
+        self.official_name = self._player_details[1]
+        self.pdga_number = self._player_details[2]
+
+
+    def parser(self, _base_url = 'https://www.pdga.com'):
+
+        rows = self.parser_init()
+
+        parsings = []
+        for row in rows:
+            player_link = row.select('a[href*="player/"]')[0]
+            player_url = _base_url + player_link['href']
+            player_official_name = player_link.text
+            player_number = int(player_url.split('/')[-1])
+            parsings.append((player_url, player_official_name, player_number))
+                
+        if len(parsings) > 1:
+            print('There may be an issue as we parsed more than one item that matches.')
+
+        player = parsings[0]
+
+        return player[0], player[1], player[2]
+
+
+class Event(EventSearch):
+
+    __slots__ = (
+        'year', 'stream', '_results_df', '_insert_values_query', '_event_date',
+        '_search_name', '_min_date', '_max_date', '_tier', '_classification', '_search_params',
+        'table_name', 'table_exists_query', 'create_table_query', 'file_path', 'file_name'
+    )
+
+    # attributes a lazy Event fills in on first access, and what fills them
+    _lazy_attributes = {
+        'url': '_resolve_search',
+        'official_name': '_resolve_search',
+        'pdga_event_number': '_resolve_search',
+        '_event_details': '_resolve_search',
+        'table_name': '_resolve_names',
+        'table_exists_query': '_resolve_names',
+        'create_table_query': '_resolve_names',
+    }
+
+    def __init__(self, name=None, url=None, year=dt.today().year, tier=['ES', 'M'], classification=['Pro'], fast=False, stream=False, index=None, lazy=False):
+
+        self.year = int(year)
+        self.fast = fast
+        self.stream = stream
+        self._results_df = None
+        self._insert_values_query = None
+        self._event_date = None
+
+        if not url:
+            self._search_name = name.strip().replace(' ','%20')
+            self._min_date = f'{self.year}-01-01'
+            self._max_date = f'{self.year}-12-31'
+            self._tier = tier
+            self._classification = classification
+
+            self._search_params = {
+                'event': self._search_name,
+                'date_filter_min': self._min_date ,
+                'date_filter_max': self._max_date,
+                'tier': self._tier,
+                'classification': self._classification
+            }
+
+            if not lazy:
+                self._resolve_search()
+
+        else:
+            self.url = url
+            self.official_name = name
+            self.pdga_event_number = self.url.split('/')[-1]
+
+        # print(self.url)
+
+        # a lazy Event does no I/O here: the search, names and results are
+        # all resolved on first access (or together by prefetch())
+        if not lazy:
+            self._resolve_names()
+
+        # in stream mode results are pulled from iter_results() by whatever
+        # consumes them and results_df is only built if someone asks for it;
+        # insert_values_query is always rendered on first access
+        if not (self.stream or lazy):
+            self.results_df = self.event_parser(self.url)
+
+        if index is not None:
+            index.add_event(self)
+
+
+
+    def __repr__(self):
+        return self.official_name
+
+
+    def __getattr__(self, name):
+
+        # only reached for slots that haven't been set yet
+        resolver = Event._lazy_attributes.get(name)
+
+        if resolver is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        getattr(self, resolver)()
+
+        return object.__getattribute__(self, name)
+
+
+    def _resolve_search(self):
+
+        EventSearch.__init__(self, fast=self.fast, **self._search_params)
+
+        return None
+
+
+    def _resolve_names(self):
+
+        self.table_name = self.event_namer()
+        self.table_exists_query = table_exists(self.table_name)
+        self.create_table_query = create_table(self.table_name, event_table_dict())
+
+        return None
+
+
+    def _pending_page(self):
+
+        if self._results_df is None:
+            return self.url
+
+        return None
+
+
+    def _load_page(self, content):
+
+        with metrics.timer(stage='event_parser'):
+            rows = list(iter_event_rows(content))
+
+        with metrics.timer(stage='dataframe'):
+            self.results_df = compact_results(pd.DataFrame(rows, columns=list(event_table_dict().keys())))
+
+        if self._event_date is None:
+            self._event_date = event_date_parser(content) or dt(self.year, 1, 1)
+
+        return None
+
+
+    @property
+    def results_df(self):
+        if self._results_df is None:
+            self._results_df = self.event_parser(self.url)
+        return self._results_df
+    @results_df.setter
+    def results_df(self, val):
+        self._results_df = val
+
+
+    @property
+    def insert_values_query(self):
+        if self._insert_values_query is None:
+            column_names = list(event_table_dict().keys())
+            self._insert_values_query = insert_data(
+                self.table_name,
+                event_table_dict(),
+                (dict(zip(column_names, row)) for row in self.iter_results())
+            )
+        return self._insert_values_query
+    @insert_values_query.setter
+    def insert_values_query(self, val):
+        self._insert_values_query = val
+
+
+    @property
+    def event_date(self):
+        if self._event_date is None:
+            self._event_date = event_date_parser(fetch_content(self.url)) or dt(self.year, 1, 1)
+        return self._event_date
+
+
+    def iter_results(self):
+
+        if self._results_df is not None:
+            return self._results_df.itertuples(index=False, name=None)
+
+        return iter_event_rows(fetch_content(self.url))
+
+
+    def row_parser(self, row):
+        if row.select('td[class*="par"]'):
+            score = row.select('td[class*="par"]')[0].text
+        elif row.select('td[class*="dnf"]'):
+            score = "DNF"
+        else:
+            score = "ERROR"
+        result = { # could also do round scores, round ratings, and total score
+            'Place': int(row.select_one('td[class*="place"]').text),
+            'Player': row.select_one('td[class*="player"]').text,
+            'PDGA Number': int(row.select_one('td[class*="pdga-number"]').text),
+            'Player Rating': int(row.select_one('td[class*="player-rating"]').text),
+            'Score': score,
+        }
+        return result
+
+
+    def event_parser(self, url, fast=None):
+
+        if fast is None:
+            fast = self.fast
+
+        if fast:
+            content = fetch_content(url)
+            with metrics.timer(stage='event_parser'):
+                results_list = fast_event_rows(content)
+
+        else:
+            soup = soupify(url)
+            with metrics.timer(stage='event_parser'):
+                soup_table = soup.select('div[class*="leaderboard"]')[0]
+                results_table_raw = soup_table.select('div[class*="table-container"]')[0]
+                odd_rows = results_table_raw.select('tr[class*="odd"]')
+                even_rows = results_table_raw.select('tr[class*="even"]')
+                results_raw = [x for x in itertools.chain.from_iterable(itertools.zip_longest(odd_rows,even_rows)) if x]
+                results_list = [self.row_parser(row) for row in results_raw]
+            metrics.inc('dg_fantasy_rows_parsed_total', len(results_list), source='event')
+
+        with metrics.timer(stage='dataframe'):
+            results_df = compact_results(pd.DataFrame(data=results_list)) #.set_index('Place')
+            
+        return results_df
+
+
+    def save_event_results(self, file_path='', store=None):
+
+        file_name = f'Results_{self.official_name.replace(" ","-")}.csv'
+
+        if self._results_df is not None and len(self._results_df) == 0:
+            print(f'Results for "{self}" do not exist.')
+
+        elif store is not None:
+            store.write_event(self)
+            file_path = store.root
+            file_name = store.partition_path(self.year, self.pdga_event_number)
+            print(f'{file_name} has been saved.')
+
+        elif self._results_df is not None:
+            self.results_df.to_csv(file_path + file_name)
+            print(f'{file_name} has been saved.')
+
+        elif write_rows_csv(self.iter_results(), file_path + file_name, event_table_dict()):
+            print(f'{file_name} has been saved.')
+
+        else:
+            os.remove(file_path + file_name)
+            print(f'Results for "{self}" do not exist.')
+
+        setattr(self, 'file_path', file_path)
+        setattr(self, 'file_name', file_name)
+
+        return None
+
+
+    def event_namer(self):
+        return name_event(self.official_name, self.year)
+
+
+    def event_status(self):
+
+        # served from the response cache when the page was just parsed
+        if event_is_complete(fetch_content(self.url)):
+            return 'Complete'
+
+        return 'In Progress'
+
+
+    def build_event_table(self, bulk=True):
+
+        with metrics.timer(stage='build_event_table'), sql_transaction() as postgres:
+
+            postgres.execute(self.table_exists_query)
+
+            if not postgres.fetchone():
+                print(f'Table named "{self.table_name}" does not exist.')
+                postgres.execute(self.create_table_query)
+
+            else:
+                print(f'Table named "{self.table_name}" already exists.')
+                pass
+
+            if bulk:
+                copy_data(postgres, self.table_name, event_table_dict(), self.iter_results())
+            else:
+                postgres.execute(self.insert_values_query)
+
+            print(f'Values inserted into "{self.table_name}" table.')
+
+        return None
+
+#     def pickle_that_shit(self, file_path=''):
+
+#         if file_path[-4:] != '.pkl':
+#             if '.' in file_path:
+#                 file_path = file_path.split('.')[0]
+
+#             file_path = file_path + '.pkl'
+
+#         with open(file_path, 'wb') as outp:
+#     company1 = Company('banana', 40)
+#     pickle.dump(company1, outp, pickle.HIGHEST_PROTOCOL)
+
+#     company2 = Company('spam', 42)
+#     pickle.dump(company2, outp, pickle.HIGHEST_PROTOCOL)
+
+# class Company(object):
+#     def __init__(self, name, value):
+#         self.name = name
+#         self.value = value
+
+
+
+# del company1
+# del company2
+
+# with open('company_data.pkl', 'rb') as inp:
+#     company1 = pickle.load(inp)
+#     print(company1.name)  # -> banana
+#     print(company1.value)  # -> 40
+
+#     company2 = pickle.load(inp)
+#     print(company2.name) # -> spam
+#     print(company2.value)  # -> 42
+
+
+def player_name_key(name):
+    return ' '.join(name.strip().title().split())
+
+
+class PlayerRegistry:
+
+    def __init__(self, file_path=None):
+
+        self.file_path = file_path
+        self.players = {}
+        self._names = {}
+
+        if self.file_path and os.path.exists(self.file_path):
+            with open(self.file_path) as f:
+                for pdga_number, entry in json.load(f).items():
+                    entry['observed'] = dt.fromisoformat(entry['observed'])
+                    self._set(int(pdga_number), entry)
+
+    def __repr__(self):
+        return f'PlayerRegistry({len(self.players)} players)'
+
+    def __len__(self):
+        return len(self.players)
+
+    def __contains__(self, pdga_number):
+        return int(pdga_number) in self.players
+
+    def __getitem__(self, pdga_number):
+        return self.players[int(pdga_number)]
+
+    def _set(self, pdga_number, entry):
+
+        previous = self.players.get(pdga_number)
+
+        if previous is not None and self._names.get(player_name_key(previous['name'])) == pdga_number:
+            del self._names[player_name_key(previous['name'])]
+
+        self.players[pdga_number] = entry
+        self._names[player_name_key(entry['name'])] = pdga_number
+
+        return None
+
+    def observe(self, pdga_number, name, rating, observed, event=None):
+
+        pdga_number = int(pdga_number)
+        previous = self.players.get(pdga_number)
+
+        # keep whatever was seen most recently, results can arrive in any order
+        if previous is None or observed >= previous['observed']:
+            self._set(pdga_number, {
+                'name': name,
+                'rating': int(rating),
+                'observed': observed,
+                'event': event,
+            })
+
+        return None
+
+    def add_event(self, event):
+
+        observed = event.event_date
+
+        for place, name, pdga_number, rating, score in event.iter_results():
+            self.observe(pdga_number, name, rating, observed, event.table_name)
+
+        return None
+
+    def find(self, name):
+
+        if not name:
+            return None
+
+        return self._names.get(player_name_key(name))
+
+    def save(self, file_path=None):
+
+        file_path = file_path or self.file_path
+
+        data = {
+            str(pdga_number): {**entry, 'observed': entry['observed'].isoformat()}
+            for pdga_number, entry in self.players.items()
+        }
+
+        with open(file_path + '.tmp', 'w') as f:
+            json.dump(data, f)
+
+        os.replace(file_path + '.tmp', file_path)
+
+        return None
+
+
+def normalize_name(name):
+
+    # lowercase ascii words: "José  O'Brien-Smith" -> "jose o brien smith"
+    name = unicodedata.normalize('NFKD', name or '')
+    name = ''.join(c for c in name if not unicodedata.combining(c)).lower()
+
+    return ' '.join(re.sub(r'[^a-z0-9 ]+', ' ', name).split())
+
+
+def soundex(token):
+
+    codes = {c: str(d) for d, letters in enumerate(['aeiouyhw', 'bfpv', 'cgjkqsxz', 'dt', 'l', 'mn', 'r']) for c in letters}
+    token = ''.join(c for c in token.lower() if c in codes)
+
+    if not token:
+        return ''
+
+    encoded, previous = token[0].upper(), codes[token[0]]
+
+    for c in token[1:]:
+        code = codes[c]
+        if code != '0' and code != previous:
+            encoded += code
+        # h and w don't separate letters with the same code, vowels do
+        if c not in 'hw':
+            previous = code
+
+    return (encoded + '000')[:4]
+
+
+def name_trigrams(normalized):
+
+    padded = f'  {normalized} '
+
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerNameIndex:
+
+    # answers "which PDGA number is this name" locally: token, soundex and
+    # trigram postings narrow the candidates, then each is scored on trigram
+    # similarity, shared tokens and shared sounds
+
+    def __init__(self, players=()):
+
+        self.names = {}
+        self._keys = {}
+        self._exact = {}
+        self._tokens = {}
+        self._sounds = {}
+        self._trigrams = {}
+
+        for pdga_number, name in players:
+            self.add(pdga_number, name)
+
+    def __repr__(self):
+        return f'PlayerNameIndex({len(self.names)} players)'
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, pdga_number):
+        return int(pdga_number) in self.names
+
+    @classmethod
+    def from_sources(cls, ranking_url='https://www.pdga.com/united-states-tour-ranking-open', registry=None, events=()):
+
+        index = cls()
+
+        if ranking_url:
+            for name, link in ranking_players(ranking_url):
+                index.add(link.split('/')[-1], name)
+        if registry is not None:
+            index.add_registry(registry)
+        for event in events:
+            index.add_event(event)
+
+        return index
+
+    def add(self, pdga_number, name):
+
+        pdga_number = int(pdga_number)
+        normalized = normalize_name(name)
+
+        if not normalized or self.names.get(pdga_number) == name:
+            return None
+
+        if pdga_number in self.names:
+            self.remove(pdga_number)
+
+        tokens = set(normalized.split())
+        sounds = {soundex(token) for token in tokens}
+        trigrams = name_trigrams(normalized)
+
+        self.names[pdga_number] = name
+        self._keys[pdga_number] = (tokens, sounds, len(trigrams))
+        self._exact.setdefault(normalized, set()).add(pdga_number)
+
+        for token in tokens:
+            self._tokens.setdefault(token, set()).add(pdga_number)
+        for sound in sounds:
+            self._sounds.setdefault(sound, set()).add(pdga_number)
+        for trigram in trigrams:
+            self._trigrams.setdefault(trigram, set()).add(pdga_number)
+
+        return None
+
+    def remove(self, pdga_number):
+
+        name = self.names.pop(int(pdga_number), None)
+
+        if name is None:
+            return None
+
+        normalized = normalize_name(name)
+        tokens, sounds, _ = self._keys.pop(int(pdga_number))
+        postings = [(self._exact, normalized)]
+        postings += [(self._tokens, token) for token in tokens]
+        postings += [(self._sounds, sound) for sound in sounds]
+        postings += [(self._trigrams, trigram) for trigram in name_trigrams(normalized)]
+
+        for keys, key in postings:
+            keys.get(key, set()).discard(int(pdga_number))
+            if not keys.get(key, True):
+                del keys[key]
+
+        return None
+
+    def add_registry(self, registry):
+
+        for pdga_number, entry in registry.players.items():
+            self.add(pdga_number, entry['name'])
+
+        return None
+
+    def add_event(self, event):
+
+        for place, name, pdga_number, rating, score in event.iter_results():
+            self.add(pdga_number, name)
+
+        return None
+
+    def match(self, name, limit=5):
+
+        # [(score, pdga_number, name)], best first; an exact name scores 1.0
+        normalized = normalize_name(name)
+
+        if not normalized:
+            return []
+
+        tokens = set(normalized.split())
+        sounds = {soundex(token) for token in tokens}
+        trigrams = name_trigrams(normalized)
+
+        common = {}
+
+        for trigram in trigrams:
+            for pdga_number in self._trigrams.get(trigram, ()):
+                common[pdga_number] = common.get(pdga_number, 0) + 1
+
+        # a name sharing too few trigrams can still come back through a
+        # whole token or a sound-alike, e.g. a misspelled surname
+        floor = len(trigrams) * 0.3
+        candidates = {pdga_number for pdga_number, count in common.items() if count >= floor}
+
+        for token in tokens:
+            candidates |= self._tokens.get(token, set())
+        for sound in sounds:
+            candidates |= self._sounds.get(sound, set())
+
+        exact = self._exact.get(normalized, set())
+        scored = []
+
+        for pdga_number in candidates:
+            if pdga_number in exact:
+                scored.append((1.0, pdga_number, self.names[pdga_number]))
+                continue
+
+            other_tokens, other_sounds, other_trigrams = self._keys[pdga_number]
+            dice = 2 * common.get(pdga_number, 0) / (len(trigrams) + other_trigrams)
+            shared = len(tokens & other_tokens) / len(tokens)
+            sounds_alike = len(sounds & other_sounds) / len(sounds)
+            scored.append((round(0.5 * dice + 0.3 * shared + 0.2 * sounds_alike, 4), pdga_number, self.names[pdga_number]))
+
+        return heapq.nlargest(limit, scored)
+
+    def find(self, name, min_score=0.55, margin=0.05):
+
+        # only answers when the match is unambiguous: no other indexed name
+        # holds every word of the query ("Jones" with two Joneses is None),
+        # and every word of the query is in the best name, as is or as a
+        # sound-alike, so "Rick Robinson" never comes back as Nick Robinson
+        normalized = normalize_name(name)
+        tokens = set(normalized.split())
+
+        if not tokens:
+            return None
+
+        holders = set.intersection(*(self._tokens.get(token, set()) for token in tokens))
+
+        if len(holders) > 1:
+            return None
+
+        matches = self.match(name, limit=2)
+
+        if not matches or matches[0][0] < min_score:
+            return None
+        if len(matches) > 1 and matches[0][0] - matches[1][0] < margin:
+            return None
+
+        other_tokens, other_sounds, _ = self._keys[matches[0][1]]
+
+        if any(token not in other_tokens and soundex(token) not in other_sounds for token in tokens):
+            return None
+
+        return matches[0][1]
+
+
+class SeasonIndex:
+
+    def __init__(self, events=[]):
+
+        # PDGA number -> {event table name: (event, place, score)}
+        self.players = {}
+        self.events = {}
+        self.max_place = {}
+        self._event_players = {}
+
+        for event in events:
+            self.add_event(event)
+
+    def __repr__(self):
+        return f'SeasonIndex({len(self.events)} events, {len(self.players)} players)'
+
+    def __contains__(self, pdga_number):
+        return int(pdga_number) in self.players
+
+    def remove_event(self, event_name):
+
+        for pdga_number in self._event_players.pop(event_name, []):
+            results = self.players[pdga_number]
+            del results[event_name]
+            if not results:
+                del self.players[pdga_number]
+
+        self.events.pop(event_name, None)
+        self.max_place.pop(event_name, None)
+
+        return None
+
+    def add_event(self, event):
+
+        event_name = event.table_name
+
+        # re-adding an event replaces what we had for it
+        self.remove_event(event_name)
+
+        pdga_numbers = []
+        max_place = 0
+
+        for place, name, pdga_number, rating, score in event.iter_results():
+            pdga_number = int(pdga_number)
+
+            if isinstance(place, np.integer):
+                place = int(place)
+
+            if str(place).isnumeric():
+                max_place = max(max_place, int(place))
+
+            results = self.players.setdefault(pdga_number, {})
+
+            # first row wins if a player is listed twice, same as fantasy_score
+            if event_name not in results:
+                results[event_name] = (event, place, score)
+                pdga_numbers.append(pdga_number)
+
+        self.events[event_name] = event
+        self.max_place[event_name] = max_place
+        self._event_players[event_name] = pdga_numbers
+
+        return None
+
+    def lookup(self, pdga_number, event_name):
+        return self.players.get(int(pdga_number), {}).get(event_name)
+
+    def placement(self, event_name, place):
+
+        if place == 'DNF':
+            return self.max_place[event_name] + 1
+
+        return place
+
+    def placements(self, pdga_number, year=None):
+
+        return {
+            event_name: self.placement(event_name, place)
+            for event_name, (event, place, score) in self.players.get(int(pdga_number), {}).items()
+            if year is None or event.year == year
+        }
+
+    def totals(self, pdga_number, year=None):
+
+        placements = self.placements(pdga_number, year).values()
+
+        return sum(placements), len(placements)
+
+
+class SeasonResults:
+
+    # every result of a season (or several) as parallel typed arrays, one
+    # row per result, instead of a DataFrame or a dict per event
+
+    __slots__ = ('event_names', 'event_years', 'event', 'pdga_number', 'place', 'rating', 'score')
+
+    def __init__(self, events=[]):
+
+        self.event_names = []
+        self.event_years = np.empty(0, dtype=np.int16)
+        self.event = np.empty(0, dtype=np.int16)
+        self.pdga_number = np.empty(0, dtype=np.int32)
+        self.place = np.empty(0, dtype=np.int16)
+        self.rating = np.empty(0, dtype=np.int16)
+        self.score = pd.Categorical([])
+
+        self.add_events(events)
+
+    def __repr__(self):
+        return f'SeasonResults({len(self.event_names)} events, {len(self)} results)'
+
+    def __len__(self):
+        return len(self.pdga_number)
+
+    def add_events(self, events):
+
+        codes, pdga_numbers, places, ratings, scores, years = [], [], [], [], [], []
+
+        for event in events:
+            columns = list(zip(*event.iter_results()))
+
+            if not columns:
+                continue
+
+            codes.append(np.full(len(columns[0]), len(self.event_names) + len(years), dtype=np.int16))
+            places.append(np.array([x if str(x).isnumeric() else -1 for x in columns[0]], dtype=np.int16))
+            pdga_numbers.append(np.array(columns[2], dtype=np.int32))
+            ratings.append(np.array(columns[3], dtype=np.int16))
+            scores.append(pd.Categorical([str(x) for x in columns[4]]))
+            years.append((event.table_name, event.year))
+
+        if not years:
+            return None
+
+        self.event_names += [name for name, _ in years]
+        self.event_years = np.concatenate([self.event_years, np.array([year for _, year in years], dtype=np.int16)])
+        self.event = np.concatenate([self.event] + codes)
+        self.pdga_number = np.concatenate([self.pdga_number] + pdga_numbers)
+        self.place = np.concatenate([self.place] + places)
+        self.rating = np.concatenate([self.rating] + ratings)
+        self.score = pd.api.types.union_categoricals(([self.score] if len(self.score) else []) + scores)
+
+        return None
+
+    def add_event(self, event):
+        return self.add_events([event])
+
+    def nbytes(self):
+
+        return (
+            self.event.nbytes + self.pdga_number.nbytes + self.place.nbytes
+            + self.rating.nbytes + self.score.nbytes + self.event_years.nbytes
+        )
+
+    def to_frame(self, mask=None):
+
+        if mask is None:
+            mask = slice(None)
+
+        return pd.DataFrame({
+            'Event Name': pd.Categorical.from_codes(self.event[mask], self.event_names),
+            'Event Year': self.event_years[self.event[mask]],
+            'Place': self.place[mask],
+            'PDGA Number': self.pdga_number[mask],
+            'Player Rating': self.rating[mask],
+            'Score': self.score[mask],
+        })
+
+    def player(self, pdga_number):
+        return self.to_frame(self.pdga_number == int(pdga_number))
+
+
+def deep_sizeof(obj, seen=None):
+
+    seen = set() if seen is None else seen
+
+    if id(obj) in seen or isinstance(obj, (type, type(deep_sizeof), type(os))):
+        return 0
+
+    seen.add(id(obj))
+
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(obj.memory_usage(deep=True).sum()) if isinstance(obj, pd.DataFrame) else int(obj.memory_usage(deep=True))
+    if isinstance(obj, pd.Categorical):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        return sys.getsizeof(obj) if obj.base is None else obj.nbytes
+
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(x, seen) for x in obj)
+    elif not isinstance(obj, (str, bytes, int, float, bool, type(None))):
+        if hasattr(obj, '__dict__'):
+            size += deep_sizeof(vars(obj), seen)
+        for cls in type(obj).__mro__:
+            for slot in getattr(cls, '__slots__', ()):
+                # read the slot directly so lazy attributes aren't resolved
+                try:
+                    value = object.__getattribute__(obj, slot)
+                except AttributeError:
+                    continue
+                size += deep_sizeof(value, seen)
+
+    return size
+
+
+def memory_report(events=[], players=[], season=None, teams=[]):
+
+    # bytes held by each part of a loaded history; events, players and teams
+    # share nothing with each other so the numbers add up
+    seen = set()
+
+    report = {
+        'events': sum(deep_sizeof(event, seen) for event in events),
+        'players': sum(deep_sizeof(player, seen) for player in players),
+        'teams': sum(deep_sizeof(team, seen) for team in teams),
+    }
+
+    if season is not None:
+        report['season'] = deep_sizeof(season, seen)
+
+    report['total'] = sum(report.values())
+
+    return report
+
+
+class Player(PlayerSearch):
+
+    __slots__ = (
+        '_search_name', '_search_first_name', '_search_last_name', 'search_url',
+        'rating', 'first_name', 'last_name', 'total_score', 'number_of_events',
+        'average_score', 'player_results', 'is_active', '_registry'
+    )
+
+    # attributes a lazy Player fills in on first access, and what fills them
+    _lazy_attributes = {
+        'url': '_resolve_search',
+        'pdga_number': '_resolve_search',
+        'official_name': '_resolve_profile',
+        'rating': '_resolve_profile',
+        'first_name': '_resolve_profile',
+        'last_name': '_resolve_profile',
+    }
+    
+    def __init__(self, search_name=None, url=None, is_active=False, year=dt.today().year, registry=None, lazy=False, name_index=None):
+
+        if search_name:
+            self._search_name = search_name.strip().title()
+            self._search_first_name = self._search_name.split(' ')[0]
+            self._search_last_name = self._search_name.split(' ')[-1]
+
+        # find() is None unless the name is unambiguous, in which case the
+        # PDGA search is skipped; otherwise it falls through to the search
+        indexed = name_index.find(search_name) if not url and name_index is not None else None
+
+        if indexed is not None:
+            url = f'https://www.pdga.com/player/{indexed}'
+
+        if not url and registry is not None and registry.find(search_name) is not None:
+            url = f'https://www.pdga.com/player/{registry.find(search_name)}'
+
+        self._registry = registry
+
+        if not url:
+            self._base_url = 'https://www.pdga.com/players'
+            self.search_url = f'{self._base_url}?FirstName={self._search_first_name}&LastName={self._search_last_name}'
+
+            if not lazy:
+                self._resolve_search()
+
+        else:
+            self._base_url = None
+            self.search_url = None
+            self._search_first_name = None
+            self._search_last_name = None
+            self.url = url
+            self.pdga_number = int(self.url.split('/')[-1])
+
+        if not lazy:
+            self._resolve_profile()
+
+        self.total_score = 0
+        self.number_of_events = 0
+        self.average_score = 0
+
+        self.player_results = {
+            year: {}
+        }
+
+        self.is_active = is_active
+        
+
+    def __repr__(self):
+        return self.official_name
+
+
+    def __getattr__(self, name):
+
+        # only reached for slots that haven't been set yet
+        resolver = Player._lazy_attributes.get(name)
+
+        if resolver is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        getattr(self, resolver)()
+
+        return object.__getattribute__(self, name)
+
+
+    def _resolve_search(self):
+
+        # shares memo entries with PlayerSearch, whose search string is the same query
+        memo = get_search_memo()
+        details = memo.get(self.search_url) if memo is not None else None
+
+        if details is None:
+            _soup = soupify(self.search_url)
+            _cell = _soup.select('td[class*="pdga-number"]')[0]
+            _link = _cell.find_parent('tr').select_one('a[href*="player/"]')
+            _number = int(_cell.text.strip())
+            details = (f'https://www.pdga.com/player/{_number}', _link.text if _link is not None else None, _number)
+            if memo is not None:
+                memo.set(self.search_url, details)
+
+        self.url, self.pdga_number = details[0], int(details[2])
+
+        return None
+
+
+    def _resolve_profile(self):
+
+        # the registry already knows name and rating for anyone who has
+        # played an event we've parsed, so only fetch the profile otherwise
+        if self._cached_profile():
+            return None
+
+        if self._registry is not None:
+            metrics.inc('dg_fantasy_registry_total', result='miss')
+        self._load_page(fetch_content(self.url))
+
+        return None
+
+
+    def _cached_profile(self):
+
+        if self._registry is None or self.pdga_number not in self._registry:
+            return False
+
+        metrics.inc('dg_fantasy_registry_total', result='hit')
+        _entry = self._registry[self.pdga_number]
+        self._set_profile(_entry['name'], _entry['rating'])
+
+        return True
+
+
+    def _set_profile(self, official_name, rating):
+
+        self.official_name = official_name
+        self.rating = rating
+        self.first_name = self.official_name.split(' ')[0]
+        self.last_name = self.official_name.split(' ')[-1]
+
+        return None
+
+
+    def _pending_page(self):
+
+        try:
+            object.__getattribute__(self, 'official_name')
+        except AttributeError:
+            if not self._cached_profile():
+                return self.url
+
+        return None
+
+
+    def _load_page(self, content):
+
+        with metrics.timer(stage='player_profile_parser'):
+            self._set_profile(*player_profile_parser(content))
+
+        return None
+
+    def __eq__(self, val):
+        return self.official_name == val
+
+
+    def fantasy_score(self, event, verbose=0, index=None):
+
+        player = self.official_name
+        year = event.year
+        event_name = event.table_name
+
+        if index is not None:
+            if event_name not in index.events:
+                index.add_event(event)
+
+            _entry = index.lookup(self.pdga_number, event_name)
+            max_score = index.max_place[event_name]
+            played = _entry is not None
+
+        else:
+            results = event.results_df
+            max_score = max([x for x in results.Place.values if str(x).isnumeric()])
+            played = player in results.Player.values
+
+        if played:
+
+            if index is not None:
+                score = _entry[1]
+            else:
+                score = results[results.Player == player].Place.values[0]
+
+            if isinstance(score, np.integer):
+                score = int(score)
 
-def soupify(url):
-    page = requests.get(url)
-    soup = bs(page.content, "html.parser")
-    return soup
+            if score == 'DNF':
+                score = max_score + 1
+                # in_event = 1
+                
+            elif score == 'ERROR':
+                if verbose:
+                    print(f'Something went wrong for {player} in the "{event}" event.')
+                # in_event = 0
 
+                pass
+                
+            # else:
+            #     in_event = 1
 
-def events_list(
-        year,
-        tier=['ES', 'M'], 
-        classification=['Pro'],
-        base_url='https://www.pdga.com/tour/search',
-    ):
+            self.player_results[year][event_name] = score
 
-    tier_str = '&'.join([f'Tier[]={t}' for t in tier])
-    classification_str = '&'.join([f'Classification[]={c}' for c in classification])
-    url = f'{base_url}?date_filter[min][date]={year}-01-01&date_filter[max][date]={year}-12-31&{tier_str}&{classification_str}'
+            # if event_name in self.player_results.keys():
+            #     self.total_score -= self.player_results[event_name]
 
-    soup = soupify(url)
-    events_with_links_raw = soup.select('a[href*="/tour/event/"]')
-    events_with_links = [
-        (e.text,'https://www.pdga.com'+e['href']) for e in events_with_links_raw if e.text
-    ]
+            # else:
+            #     self.number_of_events += in_event
+                
+            # self.total_score += int(score)
 
-    return events_with_links
+            self.total_score = sum(self.player_results[year].values())
+            self.number_of_events = len(self.player_results[year])
+            
+            if self.number_of_events:
+                self.average_score = round(self.total_score / self.number_of_events, 3)
 
+            return score
 
-def players_links_list(
-        base_url='https://www.pdga.com/united-states-tour-ranking-open',
-    ):
-    
-    soup = soupify('https://www.pdga.com/united-states-tour-ranking-open')
-    table = soup.select('div[class*="table"]')[0]
-    player_data = table.select('a[class*="player-profile-link"]')
-    # player_data = table.select('a[href*="/player/"]')
-    players_links = [
-        ('https://www.pdga.com'+p['href']) for p in player_data if p.text.strip()
-    ]
+        else:
+            if verbose:
+                print(f'{player} did not play in the {event}.')
+            pass
 
-    return players_links
 
+    def years_results(self, year, i=0, index=None):
 
-def type_check(item, _type):
-    if type(item) != _type:
-        raise TypeError(f'{item} must be type {_type}')
-    else:
-        pass
+        player = self.official_name
 
+        if index is not None:
+            results = index.placements(self.pdga_number, year)
+        else:
+            results = self.player_results[year]
+        total_score = sum(results.values())
+        number_of_events = len(results)
+        if number_of_events:
+            average_score = round(total_score / number_of_events, 3)
+        else:
+            average_score = 0
 
-def table_exists(table_name):
+        if i:
+            player_line = f'{i}. {player}'
+        else:
+            player_line = f'-- {player} --'
 
-    table_exists_query = f"""SELECT 1
-FROM information_schema.tables
-WHERE table_name='{table_name}'"""
+        separator = '*' * (len(player_line)+2)
 
-    return table_exists_query
+        return f"""{separator}
+ {player_line}
+{separator}
+Number of events: {number_of_events}
+Total score: {total_score}
+Average score: {average_score:.3f}
+Weighted average: {round(total_score / (number_of_events * 0.5), 3):.3f}
+"""     
 
 
-def create_table(table_name, table_columns):
+    def update_status(self, activate=True):
 
-    columns_list = [f'"{column}" {datatype}' for column,datatype in table_columns.items()]
-    columns_query = ',\n\t'.join(columns_list)
+        action_dict = {
+            True: 'active',
+            False: 'inactive'
+        }
 
-    create_table_query = f'''CREATE TABLE "{table_name}" (
-    {columns_query}
-);'''
+        if self.is_active == activate:
+            print(f'{player} is already {action_dict[activate]}')
+        else:
+            player.is_active = activate
 
-    return create_table_query
+        return None
 
 
-def insert_data(table_name, table_columns, data, truncate=True):
+def event_scores(events):
 
-    column_names = table_columns.keys()
+    # one long frame of every (event, result) pair across the whole field,
+    # with DNFs already scored as max + 1
+    frames = []
 
-    insert_list = []
+    for i, event in enumerate(events):
+        columns = list(zip(*event.iter_results()))
+        # Place, Name and PDGA Number are the first three fields of a result row
+        if columns:
+            frames.append(pd.DataFrame({'Event': i, 'PDGA Number': columns[2], 'Name': columns[1], 'Place': columns[0]}))
 
-    for i,_dict in enumerate(data):
+    if frames:
+        results = pd.concat(frames, ignore_index=True)
+    else:
+        results = pd.DataFrame(columns=['Event', 'PDGA Number', 'Name', 'Place'])
 
-        data_to_insert = []
+    results['PDGA Number'] = pd.to_numeric(results['PDGA Number'], errors='coerce')
+    places = pd.to_numeric(results['Place'], errors='coerce')
+    max_score = places.groupby(results['Event']).transform('max')
 
-        for column_name,datum in _dict.items():
-            if "varchar" in table_columns[column_name]:
-                datum = "'" + datum.replace("'", "''") + "'"
+    is_dnf = results['Place'].astype(str) == 'DNF'
+    results['Score'] = places.where(~is_dnf, max_score + 1)
 
-            data_to_insert.append(str(datum))
+    results['Max Place'] = max_score
 
-        insert_list.append('(' + ','.join(data_to_insert) + ')')
+    # a player only counts once per event, same as the first match in fantasy_score
+    return results.dropna(subset=['Score']).drop_duplicates(['Event', 'PDGA Number'])
 
-    insert_values = '\n\t,'.join(insert_list) + '\n;'
 
-    if truncate:
+def score_season(events, players):
 
-        insert_query = f'''TRUNCATE TABLE "{table_name}";
+    results = event_scores(events)
 
-'''
+    pool = pd.DataFrame({
+        'Player Index': np.arange(len(players)),
+        'PDGA Number': [int(player.pdga_number) for player in players],
+    })
+
+    scores = results.merge(pool, on='PDGA Number', how='inner')
+    scores['Score'] = scores['Score'].astype(int)
+    scores['Event Year'] = [events[i].year for i in scores['Event'].values]
+    scores['Event Name'] = [events[i].table_name for i in scores['Event'].values]
 
+    years = sorted({event.year for event in events})
+
+    # totals for the most recent season in the batch, like fantasy_score leaves them
+    if years:
+        latest = scores[scores['Event Year'] == years[-1]]
+        totals = latest.groupby('Player Index')['Score'].agg(['sum', 'count'])
     else:
-        insert_query = ''
+        totals = pd.DataFrame(columns=['sum', 'count'])
 
-    insert_query += f'''INSERT INTO "{table_name}" ({",".join(column_names)})
-VALUES {insert_values}'''
+    for player in players:
+        for year in years:
+            player.player_results[year] = {}
 
-    return insert_query
+    for player_index, year, event_name, score in zip(
+        scores['Player Index'].values,
+        scores['Event Year'].values,
+        scores['Event Name'].values,
+        scores['Score'].values
+    ):
+        players[player_index].player_results[year][event_name] = int(score)
 
+    totals_sum = totals['sum'].to_dict()
+    totals_count = totals['count'].to_dict()
 
-def player_table_dict():
+    for i, player in enumerate(players):
+        player.total_score = int(totals_sum.get(i, 0))
+        player.number_of_events = int(totals_count.get(i, 0))
+        player.average_score = round(player.total_score / player.number_of_events, 3) if player.number_of_events else 0
 
-    return {
-        'Name': 'varchar(200)',
-        'PDGA Number': 'bigint',
-        'Event Name': 'varchar(500)',
-        'Place': 'int',
-        'Event Year': 'int',
-        'Event Status': 'varchar(50)'
-    }
+    return scores[['PDGA Number', 'Event Year', 'Event Name', 'Score']].reset_index(drop=True)
 
 
-def event_table_dict():
+def results_store_schema():
 
     return {
-        'Place': 'int',
-        'Player': 'varchar(200)',
-        'PDGA Number': 'bigint',
-        'Player Rating': 'int',
-        'Score': 'varchar(10)'
+        'Place': 'int16',
+        'Player': 'string',
+        'PDGA Number': 'int32',
+        'Player Rating': 'int16',
+        'Score': 'dictionary',
+        'Event Name': 'dictionary',
+        'Event Year': 'int16',
+        'Event Number': 'int32',
     }
 
 
-def league_table_dict():
+class ResultsStore:
 
-    return {
-        'Team Name': 'varchar(100)',
-        'Team Owner': 'varchar(100)',
-        'Number of Players': 'int',
-        'Number of Active Players': 'int',
-        'Wins': 'int',
-        'Losses': 'int',
-        'Ties': 'int',
-        'First Place': 'int',
-        'Second Place': 'int',
-        'Third Place': 'int',
-    }
+    def __init__(self, root='parquet_results'):
 
+        if pa is None:
+            raise ImportError('ResultsStore requires pyarrow (pip install pyarrow)')
 
-class Search:
+        self.root = root
+        self.schema = pa.schema([
+            (column, pa.dictionary(pa.int16(), pa.string()) if datatype == 'dictionary' else pa.type_for_alias(datatype))
+            for column, datatype in results_store_schema().items()
+        ])
+        self.partitioning = ds.partitioning(
+            pa.schema([self.schema.field('Event Year'), self.schema.field('Event Number')]),
+            flavor='hive'
+        )
 
-    def __init__(self, search_type, **kwargs):
+    def __repr__(self):
+        return f'ResultsStore({self.root!r})'
 
-        self._search_type = search_type.title()
+    def partition_path(self, year, event_number):
+        return os.path.join(f'Event Year={int(year)}', f'Event Number={int(event_number)}')
 
-        self._search_options = {
-            'Event': {
-                'base_url': 'https://www.pdga.com/tour/search',
-                'reqs': [
-                    'event',
-                    'date_filter_min',
-                    'date_filter_max',
-                    'tier',
-                    'classification'
+    def write_results(self, results_df, year, event_number, event_name):
+
+        frame = results_df[['Place', 'Player', 'PDGA Number', 'Player Rating', 'Score']].copy()
+        frame['Score'] = frame['Score'].astype(str)
+        frame['Event Name'] = event_name
+        frame['Event Year'] = int(year)
+        frame['Event Number'] = int(event_number)
+
+        table = pa.Table.from_pandas(frame, schema=self.schema, preserve_index=False)
+
+        # rewriting an event replaces its partition instead of appending to it
+        ds.write_dataset(
+            table,
+            self.root,
+            format='parquet',
+            partitioning=self.partitioning,
+            existing_data_behavior='delete_matching',
+            basename_template='results-{i}.parquet'
+        )
+
+        return None
+
+    def write_rows(self, rows, year, event_number, event_name, batch_size=5000):
+
+        column_names = list(event_table_dict().keys())
+        schema = self.schema
+
+        def batches():
+            rows_iter = iter(rows)
+            while True:
+                batch = list(itertools.islice(rows_iter, batch_size))
+                if not batch:
+                    break
+                columns = [list(column) for column in zip(*batch)]
+                columns[4] = [str(x) for x in columns[4]]
+                arrays = [
+                    pa.array(column, type=schema.field(column_name).type)
+                    if column_name != 'Score' else pa.array(column).dictionary_encode().cast(schema.field('Score').type)
+                    for column_name, column in zip(column_names, columns)
                 ]
-            },
-            'Player': {
-                'base_url': 'https://www.pdga.com/players',
-                'reqs':  [
-                    'first_name',
-                    'last_name'
+                n = len(batch)
+                arrays += [
+                    pa.array([event_name] * n).dictionary_encode().cast(schema.field('Event Name').type),
+                    pa.array([int(year)] * n, type=schema.field('Event Year').type),
+                    pa.array([int(event_number)] * n, type=schema.field('Event Number').type),
                 ]
-            }
+                yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+        ds.write_dataset(
+            pa.RecordBatchReader.from_batches(schema, batches()),
+            self.root,
+            format='parquet',
+            partitioning=self.partitioning,
+            existing_data_behavior='delete_matching',
+            basename_template='results-{i}.parquet'
+        )
+
+        return None
+
+    def write_event(self, event):
+
+        self.write_rows(event.iter_results(), event.year, event.pdga_event_number, event.table_name)
+
+        return None
+
+    def dataset(self):
+        return ds.dataset(self.root, format='parquet', partitioning=self.partitioning)
+
+    def read(self, pdga_number=None, year=None, event_number=None, columns=None):
+
+        filters = []
+
+        # partition columns prune whole directories, PDGA Number is pushed
+        # down to the parquet row group statistics
+        for column, value in [('Event Year', year), ('Event Number', event_number), ('PDGA Number', pdga_number)]:
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                filters.append(ds.field(column).isin([int(x) for x in value]))
+            else:
+                filters.append(ds.field(column) == int(value))
+
+        _filter = None
+        for condition in filters:
+            _filter = condition if _filter is None else _filter & condition
+
+        if not os.path.isdir(self.root):
+            return pd.DataFrame(columns=columns or list(results_store_schema().keys()))
+
+        table = self.dataset().to_table(columns=columns, filter=_filter)
+
+        return table.to_pandas()
+
+
+def import_csv_results(store, csv_dir='csv_results', year=2023, events=None):
+
+    # csv files are named after an event with dashes for spaces, either the
+    # official name (as Event writes them) or the short name name_event gives
+    # it, e.g. "Des-Moines-Challenge"; the year's event list maps either one
+    # back to the official name and event number
+    if events is None:
+        events = events_list(year)
+
+    catalog = {}
+
+    for official_name, url in events:
+        short_name = name_event(official_name, year).rsplit(', ', 1)[0]
+        for key in {normalize_name(official_name), normalize_name(short_name)}:
+            catalog.setdefault(key, set()).add((official_name, int(url.split('/')[-1])))
+
+    imported = []
+    errors = []
+
+    for file_name in sorted(os.listdir(csv_dir)):
+
+        if not (file_name.startswith('Results_') and file_name.endswith('.csv')):
+            continue
+
+        event_slug = file_name[len('Results_'):-len('.csv')]
+        matches = catalog.get(normalize_name(event_slug.replace('-', ' ')), set())
+
+        if len(matches) != 1:
+            message = 'no matching event' if not matches else f'{len(matches)} matching events'
+            errors.append({'item': file_name, 'error': 'KeyError', 'message': message})
+            continue
+
+        (official_name, event_number), = matches
+        results_df = pd.read_csv(os.path.join(csv_dir, file_name), index_col=0)
+
+        store.write_results(results_df, year, event_number, name_event(official_name, year))
+        imported.append(file_name)
+
+    return imported, errors
+
+
+def scrape_all(build, items, workers=8):
+
+    results = [None] * len(items)
+    errors = []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(build, item): i for i, item in enumerate(items)}
+
+        for future in as_completed(futures):
+            i = futures[future]
+
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                errors.append({
+                    'index': i,
+                    'item': items[i],
+                    'error': type(e).__name__,
+                    'message': str(e),
+                })
+
+    results = [x for x in results if x is not None]
+    errors = sorted(errors, key=lambda x: x['index'])
+
+    return results, errors
+
+
+def scrape_events(event_details, workers=8, **kwargs):
+
+    def build(details):
+        event_name, link = details
+        return Event(name=event_name, url=link, **kwargs)
+
+    return scrape_all(build, list(event_details), workers=workers)
+
+
+def scrape_players(players_links, workers=8, **kwargs):
+
+    def build(link):
+        return Player(url=link, **kwargs)
+
+    return scrape_all(build, list(players_links), workers=workers)
+
+
+def prefetch(objects, workers=8):
+
+    # resolves a collection of lazy Events and Players together: searches
+    # first, since they decide the page URLs, then every page the objects
+    # still need in one concurrent fetch, each page parsed by its owners
+    objects = list(objects)
+
+    def unresolved(obj, name):
+        try:
+            object.__getattribute__(obj, name)
+        except AttributeError:
+            return True
+        return False
+
+    searches = [obj for obj in objects if unresolved(obj, 'url')]
+    _, errors = scrape_all(lambda obj: obj._resolve_search(), searches, workers=workers)
+
+    pages = {}
+
+    for obj in objects:
+        if unresolved(obj, 'url'):
+            continue
+        url = obj._pending_page()
+        if url is not None:
+            pages.setdefault(url, []).append(obj)
+
+    def load(url):
+        content = fetch_content(url)
+        for obj in pages[url]:
+            obj._load_page(content)
+
+    _, page_errors = scrape_all(load, list(pages), workers=workers)
+
+    return objects, errors + page_errors
+
+
+def row_hashes(results_df):
+
+    return pd.util.hash_pandas_object(results_df, index=False).map('{:016x}'.format)
+
+
+class SyncManifest:
+
+    def __init__(self, file_path='sync_manifest.json'):
+
+        self.file_path = file_path
+
+        try:
+            with open(self.file_path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+
+        self.events = data.get('events', {})
+        self.players = data.get('players', {})
+
+    def __repr__(self):
+        return f'SyncManifest({self.file_path!r}, events={len(self.events)}, players={len(self.players)})'
+
+    def needs_fetch(self, event_number):
+
+        entry = self.events.get(str(event_number))
+
+        return entry is None or entry['status'] != 'Complete'
+
+    def record_event(self, event):
+
+        hashes = row_hashes(event.results_df)
+        key = str(event.pdga_event_number)
+        previous = set(self.events.get(key, {}).get('row_hashes', []))
+
+        self.events[key] = {
+            'name': event.official_name,
+            'url': event.url,
+            'year': event.year,
+            'status': event.event_status(),
+            'fetched_at': time.time(),
+            'content_hash': hashlib.sha256(''.join(sorted(hashes)).encode()).hexdigest(),
+            'row_hashes': list(hashes),
         }
 
-        self._search_dict = {
-            'event': {'url': 'OfficialName', 'type': str},
-            'date_filter_min': {'url': 'date_filter[min][date]', 'type': str},
-            'date_filter_max': {'url': 'date_filter[max][date]', 'type': str},
-            'tier': {'url': 'Tier[]', 'type': list},
-            'classification': {'url': 'Classification[]', 'type': list},
-            'first_name': {'url': 'FirstName', 'type': str},
-            'last_name': {'url': 'LastName', 'type': str}
+        return event.results_df[~hashes.isin(previous).values]
+
+    def record_player(self, player):
+
+        self.players[str(player.pdga_number)] = {
+            'name': player.official_name,
+            'url': player.url,
+            'fetched_at': time.time(),
         }
 
-        self._base_url = self._search_options[self._search_type]['base_url']
-        self._search_reqs = self._search_options[self._search_type]['reqs']
+        return None
+
+    def save(self):
 
-        _reqs_not_met = [x for x in self._search_reqs if x not in kwargs.keys()]
+        tmp_path = self.file_path + '.tmp'
 
-        if _reqs_not_met:
-            if len(_reqs_not_met) == 1:
-                s = ''
-                is_are = 'is'
-            else:
-                s = 's'
-                is_are = 'are'
+        with open(tmp_path, 'w') as f:
+            json.dump({'events': self.events, 'players': self.players}, f)
 
-            print(f"The following argument{s} {is_are} missing: {', '.join(reqs_not_met)}")
+        os.replace(tmp_path, self.file_path)
 
-        self.input = kwargs
+        return None
 
-        self.search_string = self._base_url + '?'
 
-        _number_of_reqs = len(self._search_reqs)
+def sync_season(
+        year,
+        manifest,
+        tier=['ES', 'M'],
+        classification=['Pro'],
+        players=True,
+        workers=8,
+    ):
 
-        for i, item in enumerate(self._search_reqs):
+    event_details = [
+        (name, url) for name, url in events_list(year, tier=tier, classification=classification)
+        if manifest.needs_fetch(url.split('/')[-1])
+    ]
 
-            item_input = self.input[item]
-            item_url_term = self._search_dict[item]['url']
-            item_req_type = self._search_dict[item]['type']
+    events, errors = scrape_events(event_details, workers=workers, year=year)
 
-            type_check(item_input, item_req_type)
+    changed_rows = {}
 
-            if item_req_type == list:
-                url_part = '&'.join([f'{item_url_term}={x}' for x in item_input])
+    for event in events:
+        rows = manifest.record_event(event)
+        if len(rows):
+            changed_rows[event.pdga_event_number] = rows
 
-            elif item_req_type == str:
-                url_part = f'{item_url_term}={item_input}'
+    new_players = []
 
-            else:
-                print('Something went wrong with _search_reqs')
+    if players:
+        players_links = [
+            link for link in players_links_list()
+            if link.split('/')[-1] not in manifest.players
+        ]
 
-            self.search_string += url_part.replace(' ','%20')
+        new_players, player_errors = scrape_players(players_links, workers=workers, year=year)
+        errors += player_errors
 
-            if i != _number_of_reqs - 1:
-                self.search_string += '&'
+        for player in new_players:
+            manifest.record_player(player)
 
-        self._soup = soupify(self.search_string)
+    manifest.save()
 
+    return {
+        'events': [event for event in events if event.pdga_event_number in changed_rows],
+        'changed_rows': changed_rows,
+        'players': new_players,
+        'errors': errors,
+    }
 
-    def parser_init(self):
 
-        soup = self._soup
-        table = soup.select('div[class*="table-container"]')[0]
+def event_page_parser(content):
 
-        odd_rows = table.select('tr[class*="odd"]')
-        even_rows = table.select('tr[class*="even"]')
+    # runs in a worker process, so it returns plain tuples rather than soup
+    return list(iter_event_rows(content)), event_date_parser(content)
 
-        rows = [x for x in itertools.chain.from_iterable(itertools.zip_longest(odd_rows,even_rows)) if x]
-        
-        return rows
 
+def pipeline(urls, parser, fetch_workers=8, parse_workers=None):
 
-class EventSearch(Search):
+    # fetches run on threads and each page is handed to a process pool to
+    # parse as soon as it arrives, so parsing isn't stuck behind the GIL
+    records = {}
+    errors = []
 
-    def __init__(self, **kwargs):
-        Search.__init__(self, search_type='Event', **kwargs)
+    # forked workers would start while fetch threads hold locks (the
+    # metrics lock, connection pools) and could inherit them held forever
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
 
-        self._event_details = self.parser()
-        
-        self.url = self._event_details[0]
-        self.official_name = self._event_details[1]
-        self.pdga_event_number = self._event_details[2]
+    with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool, \
+            ProcessPoolExecutor(max_workers=parse_workers, mp_context=context) as parse_pool:
 
+        fetches = {fetch_pool.submit(fetch_content, url): url for url in urls}
+        parses = {}
 
-    def parser(self, _base_url = 'https://www.pdga.com'):
+        for future in as_completed(fetches):
+            url = fetches[future]
+            try:
+                parses[parse_pool.submit(parser, future.result())] = url
+            except Exception as e:
+                errors.append({'item': url, 'stage': 'fetch', 'error': type(e).__name__, 'message': str(e)})
 
-        rows = self.parser_init()
+        for future in as_completed(parses):
+            url = parses[future]
+            try:
+                records[url] = future.result()
+            except Exception as e:
+                errors.append({'item': url, 'stage': 'parse', 'error': type(e).__name__, 'message': str(e)})
 
-        parsings = []
-        for row in rows:
-            if row.select('td[class*="views-field views-field-Classification"]')[0].text.strip() == 'Pro':
-                event_link = row.select('a[href*="/tour/event/"]')[0]
-                event_url = _base_url + event_link['href']
-                event_official_name = event_link.text
-                event_number = int(event_url.split('/')[-1])
-                parsings.append((event_url, event_official_name, event_number))
-                
-        if len(parsings) > 1:
-            print('There may be an issue as we parsed more than one item that matches.')
+    order = {url: i for i, url in enumerate(urls)}
+    errors = sorted(errors, key=lambda x: order[x['item']])
 
-        event = parsings[0]
+    return records, errors
 
-        return event[0], event[1], event[2]
 
+def pipeline_events(event_details, fetch_workers=8, parse_workers=None, index=None, **kwargs):
 
-class PlayerSearch(Search):
+    event_details = list(event_details)
+    records, errors = pipeline([url for _, url in event_details], event_page_parser, fetch_workers, parse_workers)
 
-    def __init__(self, **kwargs):
-        Search.__init__(self, search_type='Player', **kwargs)
+    events = []
 
-        self._player_details = self.parser()
-        
-        self.url = self._player_details[0]
-        self.official_name = self._player_details[1]
-        self.pdga_number = self._player_details[2]
+    for event_name, url in event_details:
+        if url not in records:
+            continue
 
+        rows, event_date = records[url]
 
-    def parser(self, _base_url = 'https://www.pdga.com'):
+        # stream=True keeps the constructor from parsing the page itself
+        event = Event(name=event_name, url=url, stream=True, **kwargs)
+        event.results_df = compact_results(pd.DataFrame(rows, columns=list(event_table_dict().keys())))
+        event._event_date = event_date or dt(event.year, 1, 1)
 
-        rows = self.parser_init()
+        if index is not None:
+            index.add_event(event)
 
-        parsings = []
-        for row in rows:
-            player_link = row.select('a[href*="player/"]')[0]
-            player_url = _base_url + player_link['href']
-            player_official_name = player_link.text
-            player_number = int(player_url.split('/')[-1])
-            parsings.append((player_url, player_official_name, player_number))
-                
-        if len(parsings) > 1:
-            print('There may be an issue as we parsed more than one item that matches.')
+        events.append(event)
 
-        player = parsings[0]
+    return events, errors
 
-        return player[0], player[1], player[2]
 
+def pipeline_players(players_links, registry=None, fetch_workers=8, parse_workers=None, **kwargs):
 
-class Event(EventSearch):
+    registry = registry if registry is not None else PlayerRegistry()
+    players_links = list(players_links)
 
-    def __init__(self, name=None, url=None, year=dt.today().year, tier=['ES', 'M'], classification=['Pro']):
+    # anyone the registry already knows doesn't need their profile page
+    to_fetch = [link for link in players_links if link.split('/')[-1] not in registry]
+    records, errors = pipeline(to_fetch, player_profile_parser, fetch_workers, parse_workers)
 
-        self.year = int(year)
+    today = dt.today()
 
-        if not url:
-            self._search_name = name.strip().replace(' ','%20')
-            self._min_date = f'{self.year}-01-01'
-            self._max_date = f'{self.year}-12-31'
-            self._tier = tier
-            self._classification = classification
+    for link, (official_name, rating) in records.items():
+        registry.observe(link.split('/')[-1], official_name, rating, today)
 
-            self._search_params = {
-                'event': self._search_name,
-                'date_filter_min': self._min_date ,
-                'date_filter_max': self._max_date,
-                'tier': self._tier,
-                'classification': self._classification
-            }
+    failed = {error['item'] for error in errors}
+    players = [Player(url=link, registry=registry, **kwargs) for link in players_links if link not in failed]
 
-            EventSearch.__init__(self, **self._search_params)
+    return players, errors
 
-        else:
-            self.url = url
-            self.official_name = name
-            self.pdga_event_number = self.url.split('/')[-1]
 
-        # print(self.url)
+def round_robin_schedule(team_names, weeks=None):
 
-        self.table_name = self.event_namer()
+    # circle method: every team meets every other once per cycle, and an odd
+    # field gets a bye (None) each week; cycles repeat until weeks is filled
+    teams = list(team_names)
 
-        self.results_df = self.event_parser(self.url)
+    if len(teams) % 2:
+        teams.append(None)
 
-        # _exists, _create, _insert = self.sql_queries()
+    rounds = []
 
-        self.table_exists_query = table_exists(self.table_name)
+    for _ in range(len(teams) - 1):
+        half = len(teams) // 2
+        rounds.append([
+            (teams[i], teams[-1 - i]) if len(rounds) % 2 == 0 else (teams[-1 - i], teams[i])
+            for i in range(half)
+        ])
+        teams = [teams[0], teams[-1]] + teams[1:-1]
 
-        self.create_table_query = create_table(self.table_name, event_table_dict())
+    if weeks is None or not rounds:
+        return rounds
 
-        self.insert_values_query = insert_data(
-            self.table_name, 
-            event_table_dict(), 
-            self.results_df.to_dict('records')
-        )
+    return [rounds[week % len(rounds)] for week in range(weeks)]
 
 
+class SeasonData:
 
-    def __repr__(self):
-        return self.official_name
+    # one read-only copy of a season's events, results and players that any
+    # number of LeagueViews score against; nothing here is per league
 
+    __slots__ = ('events', 'event_names', 'event_years', 'players', 'names', 'pdga_numbers', 'placements', 'played', 'penalty')
 
-    def row_parser(self, row):
-        if row.select('td[class*="par"]'):
-            score = row.select('td[class*="par"]')[0].text
-        elif row.select('td[class*="dnf"]'):
-            score = "DNF"
-        else:
-            score = "ERROR"
-        result = { # could also do round scores, round ratings, and total score
-            'Place': int(row.select_one('td[class*="place"]').text),
-            'Player': row.select_one('td[class*="player"]').text,
-            'PDGA Number': int(row.select_one('td[class*="pdga-number"]').text),
-            'Player Rating': int(row.select_one('td[class*="player-rating"]').text),
-            'Score': score,
-        }
-        return result
+    def __init__(self, events, players=[]):
 
+        results = event_scores(events)
+        pdga_numbers = np.unique(results['PDGA Number'].values.astype(np.int64))
+        penalty = (results.groupby('Event')['Max Place'].max().reindex(range(len(events))).fillna(0) + 1).values.astype(np.int64)
 
-    def event_parser(self, url):
-        
-        soup = soupify(url)
-        soup_table = soup.select('div[class*="leaderboard"]')[0]
-        results_table_raw = soup_table.select('div[class*="table-container"]')[0]
-        odd_rows = results_table_raw.select('tr[class*="odd"]')
-        even_rows = results_table_raw.select('tr[class*="even"]')
-        results_raw = [x for x in itertools.chain.from_iterable(itertools.zip_longest(odd_rows,even_rows)) if x]
-        results_list = [self.row_parser(row) for row in results_raw]
-        results_df = pd.DataFrame(data=results_list) #.set_index('Place')
-            
-        return results_df
+        # players x events, with the penalty wherever a player has no result
+        placements = np.tile(penalty, (len(pdga_numbers), 1))
+        played = np.zeros(placements.shape, dtype=bool)
+        rows = np.searchsorted(pdga_numbers, results['PDGA Number'].values.astype(np.int64))
+        columns = results['Event'].values.astype(np.int64)
+        placements[rows, columns] = results['Score'].values.astype(np.int64)
+        played[rows, columns] = True
 
+        for array in (pdga_numbers, penalty, placements, played):
+            array.flags.writeable = False
 
-    def save_event_results(self, file_path=''):
+        # the name each player is listed under in the results, first seen wins
+        named = results.dropna(subset=['Name']).drop_duplicates('PDGA Number')
+        names = dict(zip(named['PDGA Number'].astype(np.int64).tolist(), named['Name']))
 
-        file_name = f'Results_{self.official_name.replace(" ","-")}.csv'
+        _set = super().__setattr__
+        _set('events', tuple(events))
+        _set('event_names', tuple(event.table_name for event in events))
+        _set('event_years', tuple(event.year for event in events))
+        _set('players', types.MappingProxyType({int(player.pdga_number): player for player in players}))
+        _set('names', types.MappingProxyType(names))
+        _set('pdga_numbers', pdga_numbers)
+        _set('placements', placements)
+        _set('played', played)
+        _set('penalty', penalty)
 
-        if len(self.results_df) == 0:
-            print(f'Results for "{self}" do not exist.')
+    def __setattr__(self, name, value):
+        raise AttributeError('SeasonData is read-only; build a new one instead')
 
-        else:
-            self.results_df.to_csv(file_path + file_name)
-            print(f'{file_name} has been saved.')
+    def __repr__(self):
+        return f'SeasonData({len(self.events)} events, {len(self.pdga_numbers)} players)'
 
-        setattr(self, 'file_path', file_path)
-        setattr(self, 'file_name', file_name)
+    def rows(self, pdga_numbers):
 
-        return None
+        # row of each player in placements, -1 for anyone without a result
+        pdga_numbers = np.asarray(pdga_numbers, dtype=np.int64)
+        rows = np.searchsorted(self.pdga_numbers, pdga_numbers)
+        found = rows < len(self.pdga_numbers)
+        found[found] = self.pdga_numbers[rows[found]] == pdga_numbers[found]
 
+        return np.where(found, rows, -1)
 
-    def event_namer(self):
-        _name = self.official_name.upper().split(' - ')[-1]
-        if 'PRESENT' in _name:
-            if 'PRESENTED' in _name:
-                event_name = _name.split('PRESENTED')[0].strip()
-            elif 'PRESENTS' in _name:
-                event_name = _name.split('PRESENTS')[-1].strip()
-                
-        elif 'POWERED' in _name:
-            event_name = _name.split('POWERED')[0].strip()
-                
-        else:
-            event_name = _name.strip()
-            
-        event_name = event_name.replace(str(self.year), '').replace('PLAY IT AGAIN SPORTS', '').replace('  ', ' ').strip()
-            
-        return f"{event_name}, {self.year}"
+    def placement_rows(self, pdga_numbers):
 
-#     def pickle_that_shit(self, file_path=''):
+        # anyone without a result takes the penalty for every event
+        rows = self.rows(pdga_numbers)
+        found = rows >= 0
+        placements = np.empty((len(rows), len(self.penalty)), dtype=np.int64)
+        placements[:] = self.penalty
+        placements[found] = self.placements[rows[found]]
 
-#         if file_path[-4:] != '.pkl':
-#             if '.' in file_path:
-#                 file_path = file_path.split('.')[0]
+        return placements
 
-#             file_path = file_path + '.pkl'
+    def player_totals(self, pdga_numbers, year=None):
 
-#         with open(file_path, 'wb') as outp:
-#     company1 = Company('banana', 40)
-#     pickle.dump(company1, outp, pickle.HIGHEST_PROTOCOL)
+        # total placement and number of events actually played, as fantasy_score counts them
+        rows = self.rows(pdga_numbers)
+        found = rows >= 0
+        totals = np.zeros(len(rows), dtype=np.int64)
+        counts = np.zeros(len(rows), dtype=np.int64)
 
-#     company2 = Company('spam', 42)
-#     pickle.dump(company2, outp, pickle.HIGHEST_PROTOCOL)
+        mask = self.played[rows[found]]
 
-# class Company(object):
-#     def __init__(self, name, value):
-#         self.name = name
-#         self.value = value
+        if year is not None:
+            mask = mask & (np.array(self.event_years, dtype=np.int64) == year)
 
+        totals[found] = np.where(mask, self.placements[rows[found]], 0).sum(axis=1)
+        counts[found] = mask.sum(axis=1)
 
+        return totals, counts
 
-# del company1
-# del company2
+    def player_name(self, pdga_number, known_names={}):
 
-# with open('company_data.pkl', 'rb') as inp:
-#     company1 = pickle.load(inp)
-#     print(company1.name)  # -> banana
-#     print(company1.value)  # -> 40
+        # a passed Player's official name, then the name in the results,
+        # then whatever the player table already held
+        player = self.players.get(pdga_number)
+        name = getattr(player, 'official_name', None) if player is not None else None
 
-#     company2 = pickle.load(inp)
-#     print(company2.name) # -> spam
-#     print(company2.value)  # -> 42
+        return name or self.names.get(pdga_number) or known_names.get(pdga_number)
 
+    def player_data(self, known_names={}):
 
-class Player(PlayerSearch):
-    
-    def __init__(self, search_name=None, url=None, is_active=False, year=dt.today().year):
+        # rows for the player table, shared by every league
+        rows, columns = np.nonzero(self.played)
 
-        if search_name:
-            self._search_name = search_name.strip().title()
-            self._search_first_name = self._search_name.split(' ')[0]
-            self._search_last_name = self._search_name.split(' ')[-1]
+        return [
+            {
+                'Name': self.player_name(int(self.pdga_numbers[row]), known_names),
+                'PDGA Number': int(self.pdga_numbers[row]),
+                'Event Name': self.event_names[column],
+                'Place': int(self.placements[row, column]),
+                'Event Year': self.event_years[column],
+                'Event Status': 'Complete',
+            }
+            for row, column in zip(rows, columns)
+        ]
 
 
-        if not url:
-            self._base_url = 'https://www.pdga.com/players'
-            self.search_url = f'{self._base_url}?FirstName={self._search_first_name}&LastName={self._search_last_name}'
-        
-            _soup = soupify(self.search_url)
-            
-            self.pdga_number = int(_soup.select('td[class*="pdga-number"]')[0].text.strip())
-            
-            self.url = f'https://www.pdga.com/player/{self.pdga_number}'
+class TeamView:
 
-        else:
-            self._base_url = None
-            self.search_url = None
-            self._search_first_name = None
-            self._search_last_name = None
-            self.url = url
-            self.pdga_number = int(self.url.split('/')[-1])
+    __slots__ = ('name', 'owner', 'roster', 'active', '_active_limit')
 
-            
-        _soup = soupify(self.url)
+    def __init__(self, owner, name, roster=(), active=None, team_active_limit=5):
 
-        try:
-            _name_raw = soup.select('div[class*="pane-page-title"]')[0].text.strip()
-        except:
-            _name_raw = re.findall('<h1>(.+) #\d{1,7}<\/h1>', str(_soup))[0]
-        self.official_name = _name_raw.split('#')[0].strip()
-        self.first_name = self.official_name.split(' ')[0]
-        self.last_name = self.official_name.split(' ')[-1]
-        rating_raw = _soup.select('li[class*="rating"]')[0].text.strip()
-        self.rating = int(re.findall(' (\d{3,4}) ', rating_raw)[0])
+        self.owner = owner.strip().title()
+        self.name = name.strip().title()
+        self.roster = tuple(int(pdga_number) for pdga_number in roster)
+        self.active = tuple(int(pdga_number) for pdga_number in (self.roster[:team_active_limit] if active is None else active))
+        self._active_limit = team_active_limit
 
-        self.total_score = 0
-        self.number_of_events = 0
-        self.average_score = 0
+    def __repr__(self):
+        return f'{self.name}, owned by {self.owner}'
 
-        self.player_results = {
-            year: {}
-        }
+    @property
+    def player_count(self):
+        return len(self.roster)
 
-        self.is_active = is_active
-        
+    @property
+    def active_player_count(self):
+        return len(self.active)
 
-    def __repr__(self):
-        return self.official_name
+    @property
+    def active_numbers(self):
+        return list(self.active)
 
-    def __eq__(self, val):
-        return self.official_name == val
 
+class LeagueView:
 
-    def fantasy_score(self, event, verbose=0):
+    # rosters and settings only; results live in the shared SeasonData
 
-        player = self.official_name
-        results = event.results_df
-        year = event.year
-        event_name = event.table_name
+    __slots__ = ('name', 'teams', 'team_total_limit', 'team_active_limit', 'league_table_name', 'schedule')
 
-        max_score = max([x for x in results.Place.values if str(x).isnumeric()])
+    def __init__(self, name, teams=(), team_total_limit=9, team_active_limit=5, league_table_name='League', schedule=None):
 
-        if player in results.Player.values:
+        self.name = name.strip()
+        self.teams = []
+        self.team_total_limit = team_total_limit
+        self.team_active_limit = team_active_limit
+        self.league_table_name = league_table_name
+        self.schedule = schedule
 
-            score = results[results.Player == player].Place.values[0]
+        for team in teams:
+            self._check_name(team.name)
+            self.teams.append(team)
 
-            if score == 'DNF':
-                score = max_score + 1
-                # in_event = 1
-                
-            elif score == 'ERROR':
-                if verbose:
-                    print(f'Something went wrong for {player} in the "{event}" event.')
-                # in_event = 0
+    def __repr__(self):
+        return self.name
 
-                pass
-                
-            # else:
-            #     in_event = 1
+    def _check_name(self, team_name):
 
-            self.player_results[year][event_name] = score
+        # matchup_engine and the league table both key teams by name
+        if any(team.name == team_name for team in self.teams):
+            raise ValueError(f'{self.name} already has a team named {team_name}')
 
-            # if event_name in self.player_results.keys():
-            #     self.total_score -= self.player_results[event_name]
+        return None
 
-            # else:
-            #     self.number_of_events += in_event
-                
-            # self.total_score += int(score)
+    def add_team(self, owner, name, roster=(), active=None):
 
-            self.total_score = sum(self.player_results[year].values())
-            self.number_of_events = len(self.player_results[year])
-            
-            if self.number_of_events:
-                self.average_score = round(self.total_score / self.number_of_events, 3)
+        if len(roster) > self.team_total_limit:
+            raise ValueError(f'{name} has {len(roster)} players; the limit is {self.team_total_limit}')
 
-            return score
+        team = TeamView(owner, name, roster, active, self.team_active_limit)
+        self._check_name(team.name)
+        self.teams.append(team)
 
-        else:
-            if verbose:
-                print(f'{player} did not play in the {event}.')
-            pass
+        return team
 
 
-    def years_results(self, year, i=0):
+def league_standings(season, leagues, year=None):
 
-        player = self.official_name
+    # every team's roster totals, both full and active, in one lookup
+    numbers, active, team_rows, teams = [], [], [], []
+
+    for league in leagues:
+        for team in league.teams:
+            active_set = set(team.active_numbers)
+            for pdga_number in (team.roster if isinstance(team, TeamView) else [int(player.pdga_number) for player in team.roster]):
+                numbers.append(pdga_number)
+                active.append(pdga_number in active_set)
+                team_rows.append(len(teams))
+            teams.append((league.name, team.name))
 
-        results = self.player_results[year]
-        total_score = sum(results.values())
-        number_of_events = len(results)
-        if number_of_events:
-            average_score = round(total_score / number_of_events, 3)
-        else:
-            average_score = 0
+    totals, counts = season.player_totals(numbers, year)
+    active = np.array(active, dtype=bool)
+    team_rows = np.array(team_rows, dtype=np.int64)
+    size = len(teams)
+
+    standings = pd.DataFrame({
+        'League': [league for league, team in teams],
+        'Team Name': [team for league, team in teams],
+        'Total Score': np.bincount(team_rows, weights=totals, minlength=size).astype(int),
+        'Number of Events': np.bincount(team_rows, weights=counts, minlength=size).astype(int),
+        'Active Total Score': np.bincount(team_rows, weights=totals * active, minlength=size).astype(int),
+        'Active Number of Events': np.bincount(team_rows, weights=counts * active, minlength=size).astype(int),
+    })
+
+    for prefix in ('', 'Active '):
+        standings[f'{prefix}Average Score'] = (
+            standings[f'{prefix}Total Score'] / standings[f'{prefix}Number of Events'].replace(0, np.nan)
+        ).round(3).fillna(0)
+
+    return standings
+
+
+def host_leagues(season, leagues, write=False, player_table_name='Players'):
+
+    # the batch job for many leagues over one SeasonData: matchups, standings
+    # and, if asked, a single player table plus the league tables
+    schedules = {league.name: league.schedule for league in leagues if getattr(league, 'schedule', None)}
+
+    with metrics.timer(stage='host_leagues'):
+        matchups = matchup_engine(leagues, season, schedules)
+        matchups['standings'] = league_standings(season, leagues)
+
+    if write:
+        # one transaction, league records first: a batch with clashing
+        # (league, team) keys is rejected before anything is written
+        with sql_transaction() as postgres:
+            write_league_records(matchups['records'])
+
+            postgres.execute(table_exists(player_table_name))
+            if not postgres.fetchone():
+                postgres.execute(create_table(player_table_name, player_table_dict()))
+
+            # the table is rewritten, so keep any name it had that this season lacks
+            postgres.execute(f'SELECT "PDGA Number", MAX("Name") FROM "{player_table_name}" WHERE "Name" IS NOT NULL GROUP BY "PDGA Number";')
+            copy_data(postgres, player_table_name, player_table_dict(), season.player_data(dict(postgres.fetchall())))
+
+    return matchups
+
+
+def matchup_engine(leagues, events, schedules=None):
+
+    # scores every team of every league against every event in one pass:
+    # team score is the sum of its active players' placements, and an active
+    # spot whose player skipped the event (or is empty) costs max place + 1.
+    # events may be a list of Event objects or a prebuilt SeasonData
+    season = events if isinstance(events, SeasonData) else SeasonData(events)
+    events = season.events
+    event_names = list(season.event_names)
+    penalty = season.penalty
+
+    teams, player_numbers, slot_rows = [], [], []
+    empty_slots = []
+    schedules = schedules or {}
+
+    for league in leagues:
+        for team in league.teams:
+            row = len(teams)
+            teams.append((league, team))
+            active = team.active_numbers
+            player_numbers += active
+            slot_rows += [row] * len(active)
+            empty_slots.append(max(team._active_limit - len(active), 0))
+
+    scores = np.zeros((len(teams), len(events)), dtype=np.int64)
+    np.add.at(scores, np.array(slot_rows, dtype=np.int64), season.placement_rows(player_numbers))
+    scores += np.outer(np.array(empty_slots, dtype=np.int64), penalty)
+
+    # head to head: week w of a league's schedule is played on events[w]
+    home, away, week_event = [], [], []
+    offset = 0
+
+    for league in leagues:
+        rows = {team.name: offset + i for i, team in enumerate(league.teams)}
+        schedule = schedules.get(league.name) or round_robin_schedule(rows, weeks=len(events))
+        for week, games in enumerate(schedule[:len(events)]):
+            for home_team, away_team in games:
+                if home_team is not None and away_team is not None:
+                    home.append(rows[home_team])
+                    away.append(rows[away_team])
+                    week_event.append(week)
+        offset += len(league.teams)
+
+    home, away, week_event = (np.array(x, dtype=np.int64) for x in (home, away, week_event))
+    home_scores, away_scores = scores[home, week_event], scores[away, week_event]
+    size = len(teams)
+
+    def tally(mask_home, mask_away):
+        return (np.bincount(home, weights=mask_home, minlength=size) + np.bincount(away, weights=mask_away, minlength=size)).astype(int)
+
+    wins = tally(home_scores < away_scores, away_scores < home_scores)
+    losses = tally(home_scores > away_scores, away_scores > home_scores)
+    ties = tally(home_scores == away_scores, away_scores == home_scores)
+
+    # podiums: rank within each league per event, ties share the higher place
+    league_ids = np.repeat(np.arange(len(leagues)), [len(league.teams) for league in leagues])
+    long = pd.DataFrame({
+        'League': np.repeat(league_ids, len(events)),
+        'Event': np.tile(np.arange(len(events)), size),
+        'Score': scores.ravel(),
+    })
+    ranks = long.groupby(['League', 'Event'])['Score'].rank(method='min').values.reshape(size, len(events))
+    podiums = [(ranks == place).sum(axis=1) for place in (1, 2, 3)]
+
+    records = pd.DataFrame({
+        'League': [league.name for league, team in teams],
+        'League Table': [league.league_table_name for league, team in teams],
+        'Team Name': [team.name for league, team in teams],
+        'Team Owner': [team.owner for league, team in teams],
+        'Number of Players': [team.player_count for league, team in teams],
+        'Number of Active Players': [team.active_player_count for league, team in teams],
+        'Wins': wins,
+        'Losses': losses,
+        'Ties': ties,
+        'First Place': podiums[0],
+        'Second Place': podiums[1],
+        'Third Place': podiums[2],
+    })
+
+    matchups = pd.DataFrame({
+        'League': [teams[i][0].name for i in home],
+        'Event Name': [event_names[i] for i in week_event],
+        'Home': [teams[i][1].name for i in home],
+        'Away': [teams[i][1].name for i in away],
+        'Home Score': home_scores,
+        'Away Score': away_scores,
+    })
+
+    scores = pd.DataFrame(scores, columns=event_names, index=pd.MultiIndex.from_frame(records[['League', 'Team Name']]))
+
+    return {'records': records, 'scores': scores, 'matchups': matchups}
+
+
+def write_league_records(records):
+
+    # one staging COPY and one UPDATE/INSERT per league table, however many
+    # leagues share it
+    table_columns = league_table_dict()
+    columns = ','.join([f'"{column}"' for column in table_columns])
+    updates = ','.join([f'"{column}"=s."{column}"' for column in table_columns if column not in ('League Name', 'Team Name')])
+    key = 't."League Name" = s."League Name" AND t."Team Name" = s."Team Name"'
+
+    records = records.assign(**{'League Name': records['League']})
+    duplicates = records[records.duplicated(['League Table', 'League Name', 'Team Name'], keep=False)]
+
+    if len(duplicates):
+        pairs = ', '.join(sorted({f'{league}/{team}' for league, team in zip(duplicates['League Name'], duplicates['Team Name'])}))
+        raise ValueError(f'Duplicate league/team keys in the same league table: {pairs}')
+
+    with metrics.timer(stage='write_league_records'), sql_transaction() as postgres:
+
+        columns_list = [f'"{column}" {datatype}' for column, datatype in table_columns.items()]
+        postgres.execute(f'CREATE TEMP TABLE IF NOT EXISTS "_league_records" ({", ".join(columns_list)}) ON COMMIT DROP;')
+
+        for table_name, rows in records.groupby('League Table', sort=False):
+
+            postgres.execute(table_exists(table_name))
+
+            if not postgres.fetchone():
+                postgres.execute(create_table(table_name, table_columns))
+            else:
+                postgres.execute(add_league_name_column(table_name))
 
-        if i:
-            player_line = f'{i}. {player}'
-        else:
-            player_line = f'-- {player} --'
+            copy_data(postgres, '_league_records', table_columns, rows[list(table_columns)].to_dict('records'))
 
-        separator = '*' * (len(player_line)+2)
+            postgres.execute(
+                f'''UPDATE "{table_name}" AS t
+SET {updates}
+FROM "_league_records" AS s
+WHERE {key};'''
+            )
+            postgres.execute(
+                f'''INSERT INTO "{table_name}" ({columns})
+SELECT {columns} FROM "_league_records" AS s
+WHERE NOT EXISTS (SELECT 1 FROM "{table_name}" AS t WHERE {key});'''
+            )
 
-        return f"""{separator}
- {player_line}
-{separator}
-Number of events: {self.number_of_events}
-Total score: {self.total_score}
-Average score: {self.average_score:.3f}
-Weighted average: {round(self.total_score / (self.number_of_events * 0.5), 3):.3f}
-"""     
+            print(f'{len(rows)} team records written to "{table_name}".')
 
+    return None
 
-    def update_status(self, activate=True):
 
-        action_dict = {
-            True: 'active',
-            False: 'inactive'
-        }
+def simulate_chunk(seed, simulations, ratings, attendance, membership, empty_slots, games, base_wins, base_scores, noise=30.0, batch=5000):
+
+    # one worker's share of project_season: draws a performance for every
+    # player in the field per event, ranks them, and plays out the schedule
+    rng = np.random.default_rng(seed)
+    size = len(ratings)
+    players, teams = membership.shape
+    counts = np.zeros((teams, teams), dtype=np.int64)
+    sums = np.zeros((4, teams))
+
+    for start in range(0, simulations, batch):
+        n = min(batch, simulations - start)
+        wins = np.tile(base_wins, (n, 1)).astype(np.float32)
+        ties = np.zeros((n, teams), dtype=np.float32)
+        totals = np.tile(base_scores, (n, 1)).astype(np.float32)
+        rows = np.arange(n)[:, None]
+
+        for home, away in games:
+            performance = ratings + rng.normal(0, noise, (n, size)).astype(np.float32)
+            absent = rng.random((n, players)) >= attendance
+            performance[:, :players][absent] = -np.inf
+            order = np.argsort(-performance, axis=1)
+            places = np.empty((n, size), dtype=np.float32)
+            places[rows, order] = np.arange(1, size + 1, dtype=np.float32)
+
+            penalty = size - absent.sum(axis=1, keepdims=True) + 1
+            league_places = np.where(absent, penalty, places[:, :players])
+            scores = league_places @ membership + penalty * empty_slots
+            totals += scores
+
+            if len(home):
+                home_scores, away_scores = scores[:, home], scores[:, away]
+                np.add.at(wins.T, home, (home_scores < away_scores).T)
+                np.add.at(wins.T, away, (away_scores < home_scores).T)
+                np.add.at(ties.T, home, (home_scores == away_scores).T)
+                np.add.at(ties.T, away, (away_scores == home_scores).T)
+
+        # most wins first, lowest total placement breaks ties
+        positions = np.argsort(np.argsort(totals.astype(np.float64) - wins.astype(np.float64) * 1e7, axis=1), axis=1)
+        np.add.at(counts, (np.tile(np.arange(teams), n), positions.ravel()), 1)
+        sums += [wins.sum(axis=0), ties.sum(axis=0), totals.sum(axis=0), (totals ** 2).sum(axis=0)]
+
+    return counts, sums
+
+
+def project_season(
+        league,
+        events=[],
+        remaining=None,
+        year=None,
+        field_ratings=None,
+        simulations=100000,
+        noise=30.0,
+        seed=None,
+        workers=None,
+        chunk_size=10000,
+    ):
 
-        if self.is_active == activate:
-            print(f'{player} is already {action_dict[activate]}')
+    # Monte Carlo projection of the final league table from player ratings.
+    # events are the completed Event objects; remaining is the number (or a
+    # list) of events still to play and defaults to whatever events_list(year)
+    # has that events doesn't.
+    if remaining is None:
+        played = {event.url for event in events}
+        remaining = [name for name, url in events_list(year or dt.today().year) if url not in played]
+
+    n_remaining = remaining if isinstance(remaining, int) else len(remaining)
+    teams = league.teams
+    team_names = [team.name for team in teams]
+
+    base_wins = np.zeros(len(teams))
+    base_scores = np.zeros(len(teams))
+
+    if events:
+        matchups = matchup_engine([league], events)
+        base_wins = matchups['records']['Wins'].values.astype(float)
+        base_scores = matchups['scores'].sum(axis=1).values.astype(float)
+
+    # league players first in the field, then everyone else expected to enter
+    players = list({int(player.pdga_number): player for team in teams for player in team.active_roster}.values())
+    pdga_numbers = [int(player.pdga_number) for player in players]
+    results = event_scores(events)
+    observed = {}
+
+    for event in events:
+        for place, name, pdga_number, rating, score in event.iter_results():
+            observed[int(pdga_number)] = rating
+
+    median = np.median(list(observed.values())) if observed else 1000
+    ratings = [player.rating or observed.get(pdga_number, median) for player, pdga_number in zip(players, pdga_numbers)]
+
+    if field_ratings is None:
+        field_ratings = [rating for pdga_number, rating in observed.items() if pdga_number not in set(pdga_numbers)]
+        field_ratings = field_ratings[:max(0, int(results.groupby('Event').size().mean()) - len(players))] if events else []
+
+    if events:
+        played_counts = results[results['PDGA Number'].isin(pdga_numbers)].groupby('PDGA Number').size()
+        attendance = np.array([played_counts.get(pdga_number, 0) / len(events) for pdga_number in pdga_numbers])
+    else:
+        attendance = np.ones(len(players))
+
+    membership = np.zeros((len(players), len(teams)), dtype=np.float32)
+    column = {pdga_number: i for i, pdga_number in enumerate(pdga_numbers)}
+
+    for j, team in enumerate(teams):
+        for player in team.active_roster:
+            membership[column[int(player.pdga_number)], j] += 1
+
+    empty_slots = np.array([max(team._active_limit - len(team.active_roster), 0) for team in teams], dtype=np.float32)
+
+    rows = {name: i for i, name in enumerate(team_names)}
+    schedule = round_robin_schedule(team_names, weeks=len(events) + n_remaining)[len(events):]
+    games = []
+
+    for week in schedule:
+        pairs = [(rows[home], rows[away]) for home, away in week if home is not None and away is not None]
+        games.append((
+            np.array([home for home, away in pairs], dtype=np.int64),
+            np.array([away for home, away in pairs], dtype=np.int64),
+        ))
+
+    arrays = (
+        np.array(ratings + list(field_ratings), dtype=np.float32),
+        attendance.astype(np.float32),
+        membership,
+        empty_slots,
+        games,
+        base_wins,
+        base_scores,
+        noise,
+    )
+
+    # fixed chunk sizes keep results identical whatever the worker count
+    chunks = [min(chunk_size, simulations - start) for start in range(0, simulations, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    workers = workers or os.cpu_count() or 1
+
+    with metrics.timer(stage='project_season'):
+        if workers == 1 or len(chunks) == 1:
+            outcomes = [simulate_chunk(s, n, *arrays) for s, n in zip(seeds, chunks)]
         else:
-            player.is_active = activate
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(simulate_chunk, seeds, chunks, *[[a] * len(chunks) for a in arrays]))
 
-        return None
+    counts = sum(outcome[0] for outcome in outcomes)
+    sums = sum(outcome[1] for outcome in outcomes)
+    mean_score = sums[2] / simulations
+
+    projection = pd.DataFrame(counts / simulations, index=pd.Index(team_names, name='Team Name'), columns=[f'Place {i + 1}' for i in range(len(teams))])
+    projection.insert(0, 'Expected Wins', sums[0] / simulations)
+    projection.insert(1, 'Expected Ties', sums[1] / simulations)
+    projection.insert(2, 'Expected Score', mean_score)
+    projection.insert(3, 'Score Std', np.sqrt(np.maximum(sums[3] / simulations - mean_score ** 2, 0)))
+
+    return projection.sort_values('Expected Wins', ascending=False)
 
 
 class League:
@@ -663,6 +3895,31 @@ class League:
         return self.name
 
 
+    def build_standings(self, events=[], index=None):
+
+        standings = Standings(self)
+
+        for event in events:
+            standings.record_event(event, index)
+
+        return standings
+
+
+    def build_matchups(self, events, schedule=None, write=True):
+
+        matchups = matchup_engine([self], events, {self.name: schedule} if schedule else None)
+
+        if write:
+            write_league_records(matchups['records'])
+
+        return matchups
+
+
+    def project(self, events=[], remaining=None, **kwargs):
+
+        return project_season(self, events, remaining, **kwargs)
+
+
     def create_player_data(self):
         players_for_postgres = []
 
@@ -683,50 +3940,66 @@ class League:
         return players_for_postgres
 
 
-    def build_player_table(self):
+    def build_player_table(self, bulk=True):
 
-        connection, postgres = connect_to_sql()
+        with metrics.timer(stage='build_player_table'), sql_transaction() as postgres:
 
-        postgres.execute(self.player_table_exists_query)
+            postgres.execute(self.player_table_exists_query)
             
-        if not postgres.fetchone():
-            print(f'Table named "{self.player_table_name}" does not exist.')
-            postgres.execute(self.player_create_table_query)
+            if not postgres.fetchone():
+                print(f'Table named "{self.player_table_name}" does not exist.')
+                postgres.execute(self.player_create_table_query)
                 
-        else:
-            print(f'Table named "{self.player_table_name}" already exists.')
-            pass
-            
-        postgres.execute(self.player_insert_values_query)
+            else:
+                print(f'Table named "{self.player_table_name}" already exists.')
+                pass
             
-        print(f'Values inserted into "{self.player_table_name}" table.')
+            if bulk:
+                copy_data(postgres, self.player_table_name, player_table_dict(), self.player_data)
+            else:
+                postgres.execute(self.player_insert_values_query)
             
-        close_connection(connection, postgres)
+            print(f'Values inserted into "{self.player_table_name}" table.')
 
         return None
 
 
     def build_league_table(self):
 
-        connection, postgres = connect_to_sql()
+        with metrics.timer(stage='build_league_table'), sql_transaction() as postgres:
 
-        postgres.execute(self.league_table_exists_query)
+            postgres.execute(self.league_table_exists_query)
             
-        if not postgres.fetchone():
-            postgres.execute(self.league_create_table_query)
-            print(f'Table named "{self.league_table_name}" has been created.')
+            if not postgres.fetchone():
+                postgres.execute(self.league_create_table_query)
+                print(f'Table named "{self.league_table_name}" has been created.')
                 
-        else:
-            print(f'Table named "{self.league_table_name}" already exists.')
-            pass
-            
-        close_connection(connection, postgres)
+            else:
+                print(f'Table named "{self.league_table_name}" already exists.')
+                postgres.execute(add_league_name_column(self.league_table_name))
+
+            # teams are created before their league, so claim their rows now
+            for team in self.teams:
+                if team.league is None:
+                    team.league = self.name
+                    postgres.execute(
+                        f'''UPDATE "{self.league_table_name}"
+SET "League Name"=%s
+WHERE "Team Name"=%s AND "League Name" IS NULL''',
+                        (self.name, team.name)
+                    )
 
         return None
 
 
     
 class Team:
+
+    __slots__ = (
+        'owner', 'name', 'available_players', '_roster', 'player_count', 'league',
+        'league_table_name', 'active_roster', 'active_player_count',
+        'active_spots_remaining', '_limit', '_active_limit'
+    )
     
     def __init__(
         self, 
@@ -734,15 +4007,21 @@ class Team:
         name, 
         available_players, 
         roster=[],
-        league_table_name='League'
+        league_table_name='League',
+        team_total_limit=9,
+        team_active_limit=5,
+        league_name=None
 
     ):
 
         self.owner = owner.strip().title()
         self.name = name.strip().title()
-        self.roster = roster
+        self.available_players = available_players
+        self._limit = team_total_limit
+        self._active_limit = team_active_limit
+        self.roster = list(roster)
         self.player_count = len(self.roster)
-        self.league = None,
+        self.league = league_name
         self.league_table_name = league_table_name
 
         self.insert_initial_data()
@@ -754,7 +4033,7 @@ class Team:
 
         if type(player) in [Player, str]:
 
-            if player in available_players:
+            if player in self.available_players:
 
                 if player not in self.roster:
 
@@ -811,6 +4090,10 @@ class Team:
         else:
             raise TypeError(f"must be Player or str, not {_type}")
 
+    @property
+    def active_numbers(self):
+        return [int(player.pdga_number) for player in self.active_roster]
+
     @property
     def roster(self):
         return self._roster
@@ -854,7 +4137,7 @@ class Team:
         return None
 
 
-    def team_results(self, active_only=False):
+    def team_results(self, active_only=False, index=None, year=None):
 
         _total_score = 0
         _number_of_events = 0
@@ -867,8 +4150,13 @@ class Team:
                 _roster = self.roster
 
             for player in _roster:
-                _total_score += player.total_score
-                _number_of_events += player.number_of_events
+                if index is not None:
+                    _player_total, _player_events = index.totals(player.pdga_number, year)
+                    _total_score += _player_total
+                    _number_of_events += _player_events
+                else:
+                    _total_score += player.total_score
+                    _number_of_events += player.number_of_events
 
             if _number_of_events:
                 _average_score = _total_score / _number_of_events
@@ -893,6 +4181,7 @@ Weighted average: {round(_total_score / (_number_of_events * 0.5), 3):.3f}
     def insert_initial_data(self):
 
         data = {
+            'League Name': self.league,
             'Team Name': self.name,
             'Team Owner': self.owner,
             'Number of Players': 0,
@@ -905,41 +4194,405 @@ Weighted average: {round(_total_score / (_number_of_events * 0.5), 3):.3f}
             'Third Place': 0,
         }
 
-        query = insert_data(self.league_table_name, league_table_dict(), data, truncate=False)
+        with sql_transaction() as postgres:
 
-        postgres.execute(f'''SELECT 1
-FROM {self.league_table_name}
-WHERE "Team Name"=''{self.name}''
-''')
-            
-        if not postgres.fetchone():
-            postgres.execute(query)
-            print(f'"{self.name} inserted into "{self.league_table_name}".')
-                
+            postgres.execute(
+                f'''SELECT 1
+FROM "{self.league_table_name}"
+WHERE "Team Name"=%s AND "League Name" IS NOT DISTINCT FROM %s''',
+                (self.name, self.league)
+            )
+
+            if not postgres.fetchone():
+                copy_data(postgres, self.league_table_name, league_table_dict(), [data], truncate=False, method='values')
+                print(f'"{self.name}" inserted into "{self.league_table_name}".')
+
+            else:
+                print(f'"{self.name}" already exists in "{self.league_table_name}".')
+                pass
+
+        return None
+
+
+
+
+
+class Standings:
+
+    # running totals that move by the change in one result at a time, so
+    # adding or re-scoring an event never walks the whole league
+
+    def __init__(self, league=None, teams=[], players=[]):
+
+        self.results = {}
+        self.players = {}
+        self.teams = {}
+        self._year_totals = {}
+        self._player_objects = {}
+        self._memberships = {}
+        self._event_results = {}
+
+        if league is not None:
+            teams = league.teams
+            players = league.players
+
+        for player in players:
+            self._player_objects[int(player.pdga_number)] = player
+
+        for team in teams:
+            self.add_team(team.name)
+            for player in team.roster:
+                self._player_objects.setdefault(int(player.pdga_number), player)
+                self.add_player(team.name, player.pdga_number, active=player.is_active)
+
+    def __repr__(self):
+        return f'Standings({len(self.teams)} teams, {len(self.players)} players, {len(self.results)} results)'
+
+    def add_team(self, team_name):
+
+        self.teams.setdefault(team_name, {'total': 0, 'count': 0, 'active_total': 0, 'active_count': 0, 'players': {}})
+
+        return None
+
+    def _apply(self, pdga_number, delta_total, delta_count, year=None):
+
+        player = self.players.setdefault(pdga_number, {'total': 0, 'count': 0})
+        player['total'] += delta_total
+        player['count'] += delta_count
+
+        for team_name in self._memberships.get(pdga_number, ()):
+            team = self.teams[team_name]
+            team['total'] += delta_total
+            team['count'] += delta_count
+            if team['players'][pdga_number]:
+                team['active_total'] += delta_total
+                team['active_count'] += delta_count
+
+        # Player totals are per season, as fantasy_score() leaves them, so
+        # they're only written back when the result's year is known
+        if year is None:
+            return None
+
+        season = self._year_totals.setdefault((pdga_number, year), {'total': 0, 'count': 0})
+        season['total'] += delta_total
+        season['count'] += delta_count
+
+        _object = self._player_objects.get(pdga_number)
+
+        if _object is not None:
+            _object.total_score = season['total']
+            _object.number_of_events = season['count']
+            _object.average_score = round(season['total'] / season['count'], 3) if season['count'] else 0
+
+        return None
+
+    def record(self, pdga_number, event_name, placement, year=None):
+
+        pdga_number = int(pdga_number)
+        placement = int(placement)
+        key = (pdga_number, event_name)
+        previous = self.results.get(key)
+
+        if previous is None:
+            self._apply(pdga_number, placement, 1, year)
         else:
-            print(f'"{self.name} already exists in "{self.league_table_name}".')
-            pass
-            
-        close_connection(connection, postgres)
+            self._apply(pdga_number, placement - previous, 0, year)
+
+        self.results[key] = placement
+        self._event_results.setdefault(event_name, set()).add(pdga_number)
+
+        _object = self._player_objects.get(pdga_number)
+
+        if _object is not None and year is not None:
+            _object.player_results.setdefault(year, {})[event_name] = placement
 
         return None
 
+    def remove(self, pdga_number, event_name, year=None):
 
+        pdga_number = int(pdga_number)
+        previous = self.results.pop((pdga_number, event_name), None)
 
+        if previous is None:
+            return None
 
+        self._apply(pdga_number, -previous, -1, year)
+        self._event_results.get(event_name, set()).discard(pdga_number)
 
-import psycopg2
+        _object = self._player_objects.get(pdga_number)
+
+        if _object is not None and year is not None:
+            _object.player_results.get(year, {}).pop(event_name, None)
+
+        return None
+
+    def record_event(self, event, index=None):
+
+        event_name = event.table_name
+
+        if index is None:
+            index = SeasonIndex()
+        if event_name in index.events:
+            index.remove_event(event_name)
+        index.add_event(event)
+
+        placements = {
+            pdga_number: index.placement(event_name, results[event_name][1])
+            for pdga_number in index._event_players[event_name]
+            for results in [index.players[pdga_number]]
+            if str(results[event_name][1]).isnumeric() or results[event_name][1] == 'DNF'
+        }
+
+        # a re-scored event can also drop players who were in it before
+        for pdga_number in self._event_results.get(event_name, set()) - set(placements):
+            self.remove(pdga_number, event_name, event.year)
+
+        for pdga_number, placement in placements.items():
+            self.record(pdga_number, event_name, placement, event.year)
+
+        return None
+
+    def add_player(self, team_name, pdga_number, active=True):
+
+        pdga_number = int(pdga_number)
+        team = self.teams[team_name]
+        player = self.players.setdefault(pdga_number, {'total': 0, 'count': 0})
+
+        if pdga_number in team['players']:
+            return self.set_active(team_name, pdga_number, active)
+
+        team['players'][pdga_number] = active
+        self._memberships.setdefault(pdga_number, set()).add(team_name)
+        team['total'] += player['total']
+        team['count'] += player['count']
+
+        if active:
+            team['active_total'] += player['total']
+            team['active_count'] += player['count']
+
+        return None
+
+    def drop_player(self, team_name, pdga_number):
+
+        pdga_number = int(pdga_number)
+        team = self.teams[team_name]
+
+        if pdga_number not in team['players']:
+            return None
+
+        self.set_active(team_name, pdga_number, False)
+        del team['players'][pdga_number]
+        self._memberships[pdga_number].discard(team_name)
+
+        player = self.players[pdga_number]
+        team['total'] -= player['total']
+        team['count'] -= player['count']
+
+        return None
+
+    def set_active(self, team_name, pdga_number, active=True):
 
-def connect_to_sql():
+        pdga_number = int(pdga_number)
+        team = self.teams[team_name]
 
-    connection = psycopg2.connect(
-        host='localhost', 
-        database='dg_fantasy', 
-        port=5433, 
-        user='postgres', 
-        password='GE$malone'
+        if team['players'].get(pdga_number) == active:
+            return None
+
+        player = self.players[pdga_number]
+        sign = 1 if active else -1
+        team['players'][pdga_number] = active
+        team['active_total'] += sign * player['total']
+        team['active_count'] += sign * player['count']
+
+        return None
+
+    def player(self, pdga_number, year=None):
+
+        if year is None:
+            player = self.players.get(int(pdga_number), {'total': 0, 'count': 0})
+        else:
+            player = self._year_totals.get((int(pdga_number), year), {'total': 0, 'count': 0})
+        average = round(player['total'] / player['count'], 3) if player['count'] else 0
+
+        return player['total'], player['count'], average
+
+    def team(self, team_name, active_only=False):
+
+        team = self.teams[team_name]
+        prefix = 'active_' if active_only else ''
+        total, count = team[prefix + 'total'], team[prefix + 'count']
+        average = round(total / count, 3) if count else 0
+
+        return total, count, average
+
+    def league(self, active_only=False):
+
+        # lowest average placement leads
+        standings = [(team_name,) + self.team(team_name, active_only) for team_name in self.teams]
+
+        return sorted(standings, key=lambda x: (x[2] == 0, x[3], -x[2]))
+
+
+
+def live_results_url(event_number, division='MPO', round_number=1, base_url='https://www.pdga.com'):
+
+    # the JSON the live scoring app polls; far smaller than the leaderboard page
+    return f'{base_url}/apps/tournament/live-api/live_results_fetch_round?TournID={event_number}&Division={division}&Round={round_number}'
+
+
+def live_scores_parser(content):
+
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', errors='ignore')
+
+    data = json.loads(content).get('data') or {}
+    scores = data.get('scores', []) if isinstance(data, dict) else data
+    snapshot = {}
+
+    for score in scores:
+        pdga_number = score.get('PDGANum')
+        place = score.get('RunningPlace')
+        if not pdga_number or not place:
+            continue
+        snapshot[int(pdga_number)] = (
+            score.get('Name'),
+            int(place),
+            score.get('ToPar'),
+            score.get('Played'),
+        )
+
+    return snapshot
+
+
+def diff_snapshots(previous, current):
+
+    # {pdga_number: (old_place, new_place)}, with None for a player who
+    # appeared or dropped off the board since the last poll
+    changes = {}
+
+    for pdga_number, entry in current.items():
+        old = previous.get(pdga_number)
+        if old is None or old[1] != entry[1]:
+            changes[pdga_number] = (old[1] if old else None, entry[1])
+
+    for pdga_number in previous.keys() - current.keys():
+        changes[pdga_number] = (previous[pdga_number][1], None)
+
+    return changes
+
+
+class LivePoller:
+
+    __slots__ = (
+        'event_number', 'event_name', 'year', 'division', 'round_number',
+        'base_url', 'standings', 'snapshot', 'etag', 'last_modified', 'polls',
     )
 
+    def __init__(self, event_number, event_name, year, division='MPO', round_number=1, standings=None, base_url='https://www.pdga.com'):
+
+        self.event_number = event_number
+        self.event_name = event_name
+        self.year = year
+        self.division = division
+        self.round_number = round_number
+        self.base_url = base_url
+        self.standings = standings
+        self.snapshot = {}
+        self.etag = None
+        self.last_modified = None
+        self.polls = 0
+
+    def __repr__(self):
+        return f'LivePoller({self.event_name!r}, round={self.round_number}, players={len(self.snapshot)})'
+
+    @property
+    def url(self):
+        return live_results_url(self.event_number, self.division, self.round_number, self.base_url)
+
+    def poll(self):
+
+        headers = {}
+
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        page = fetch(self.url, headers=headers)
+        self.polls += 1
+
+        if page.status_code == 304:
+            metrics.inc('dg_fantasy_live_polls_total', status='not_modified')
+            return {}
+
+        metrics.inc('dg_fantasy_live_polls_total', status='changed')
+        self.etag = page.headers.get('ETag', self.etag)
+        self.last_modified = page.headers.get('Last-Modified', self.last_modified)
+
+        snapshot = live_scores_parser(page.content)
+        changes = diff_snapshots(self.snapshot, snapshot)
+        self.snapshot = snapshot
+
+        metrics.inc('dg_fantasy_live_changes_total', len(changes))
+
+        if self.standings is not None:
+            self.apply(changes)
+
+        return changes
+
+    def apply(self, changes, standings=None):
+
+        standings = standings or self.standings
+
+        for pdga_number, (old_place, new_place) in changes.items():
+            if new_place is None:
+                standings.remove(pdga_number, self.event_name, self.year)
+            else:
+                standings.record(pdga_number, self.event_name, new_place, self.year)
+
+        return None
+
+    def watch(self, interval=30, polls=None, callback=None, stop=None):
+
+        # stop is anything with is_set(), normally a threading.Event
+        count = 0
+
+        while polls is None or count < polls:
+            changes = self.poll()
+            count += 1
+
+            if changes and callback is not None:
+                callback(changes)
+
+            if stop is not None and stop.is_set():
+                break
+            if polls is None or count < polls:
+                time.sleep(interval)
+
+        return self.snapshot
+
+
+import psycopg2
+import psycopg2.extras
+import psycopg2.pool
+from contextlib import contextmanager
+
+
+def sql_settings():
+
+    return {
+        'host': 'localhost',
+        'database': 'dg_fantasy',
+        'port': 5433,
+        'user': 'postgres',
+        'password': 'GE$malone',
+    }
+
+
+def connect_to_sql(**kwargs):
+
+    connection = psycopg2.connect(**{**sql_settings(), **kwargs})
+
     executor = connection.cursor()
 
     return connection, executor
@@ -954,3 +4607,139 @@ def close_connection(connection, executor):
     connection.close()
 
     return None
+
+
+class ConnectionPool:
+
+    def __init__(self, minconn=1, maxconn=5, **kwargs):
+
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self._pool = psycopg2.pool.ThreadedConnectionPool(minconn, maxconn, **{**sql_settings(), **kwargs})
+        # ThreadedConnectionPool raises when it's exhausted, so make callers wait instead
+        self._available = threading.BoundedSemaphore(maxconn)
+        self._local = threading.local()
+
+    def __repr__(self):
+        return f'ConnectionPool(minconn={self.minconn}, maxconn={self.maxconn})'
+
+    def _healthy(self, connection):
+
+        if connection.closed:
+            return False
+
+        try:
+            with connection.cursor() as executor:
+                executor.execute('SELECT 1')
+            connection.rollback()
+            return True
+
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            return False
+
+    def checkout(self):
+
+        self._available.acquire()
+
+        try:
+            connection = self._pool.getconn()
+
+            # one retry with a fresh connection if the pooled one went stale
+            if not self._healthy(connection):
+                self._pool.putconn(connection, close=True)
+                connection = self._pool.getconn()
+
+        except Exception:
+            self._available.release()
+            raise
+
+        return connection
+
+    def checkin(self, connection, close=False):
+
+        try:
+            self._pool.putconn(connection, close=close or bool(connection.closed))
+        finally:
+            self._available.release()
+
+        return None
+
+    @contextmanager
+    def connection(self):
+
+        connection = self.checkout()
+
+        try:
+            yield connection
+        finally:
+            self.checkin(connection)
+
+    @contextmanager
+    def transaction(self):
+
+        # a transaction opened inside another one on the same thread joins it,
+        # so everything commits (or rolls back) once at the outermost scope
+        active = getattr(self._local, 'executor', None)
+
+        if active is not None:
+            yield active
+            return
+
+        connection = self.checkout()
+        broken = False
+
+        try:
+            with connection.cursor() as executor:
+                self._local.executor = executor
+                yield executor
+            connection.commit()
+
+        except Exception as e:
+            broken = isinstance(e, (psycopg2.OperationalError, psycopg2.InterfaceError))
+            if not connection.closed:
+                connection.rollback()
+            raise
+
+        finally:
+            self._local.executor = None
+            self.checkin(connection, close=broken)
+
+    def close(self):
+
+        self._pool.closeall()
+
+        return None
+
+
+_connection_pool = None
+_pool_settings = {'minconn': 1, 'maxconn': 5}
+
+
+def configure_pool(**kwargs):
+
+    global _connection_pool
+
+    with _session_lock:
+        if _connection_pool is not None:
+            _connection_pool.close()
+            _connection_pool = None
+
+        _pool_settings.update(kwargs)
+
+    return None
+
+
+def get_pool():
+
+    global _connection_pool
+
+    if _connection_pool is None:
+        with _session_lock:
+            if _connection_pool is None:
+                _connection_pool = ConnectionPool(**_pool_settings)
+
+    return _connection_pool
+
+
+def sql_transaction():
+    return get_pool().transaction()